@@ -0,0 +1,77 @@
+"""
+MongoDB command latency metrics, labeled by collection and command name.
+
+A PyMongo CommandListener registered in ``MongoDB.connect`` feeds the
+histograms rendered on ``GET /metrics``.
+"""
+
+import threading
+from typing import Dict, Tuple
+from pymongo import monitoring
+from app.utils.metrics import CounterMetric, Histogram
+from app.utils.timing import record_timing
+
+LABELS = ("collection", "command")
+
+command_duration = Histogram(
+    "mongodb_command_duration_seconds",
+    "Duration of MongoDB commands by collection and command name.",
+    LABELS,
+)
+command_errors = CounterMetric(
+    "mongodb_command_errors_total",
+    "MongoDB commands that failed, by collection and command name.",
+    LABELS,
+)
+
+
+def _collection_of(event: monitoring.CommandStartedEvent) -> str:
+    """
+    Return the collection a command targets.
+
+    Most commands carry it as the value of their first key (``{"find": "courses"}``);
+    ``getMore`` carries a cursor id there and the collection in ``collection``.
+    Database-level commands such as ``ping`` get an empty label.
+    """
+    target = event.command.get(event.command_name)
+    if not isinstance(target, str):
+        target = event.command.get("collection")
+    return target if isinstance(target, str) else ""
+
+
+class CommandMetrics(monitoring.CommandListener):
+    """Records the duration and failures of every command sent to MongoDB."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Colección de cada comando en curso; los eventos de fin no incluyen el comando
+        self._pending: Dict[Tuple[int, object], str] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        with self._lock:
+            self._pending[(event.request_id, event.connection_id)] = _collection_of(event)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._observe(event)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        command_errors.inc(self._observe(event))
+
+    def _observe(self, event) -> Tuple[str, str]:
+        """Record the duration of a finished command, also for the current request."""
+        labels = self._labels(event)
+        seconds = event.duration_micros / 1e6
+        command_duration.observe(labels, seconds)
+        # Motor ejecuta PyMongo con una copia del contexto de la solicitud
+        record_timing("db", seconds)
+        return labels
+
+    def _labels(self, event) -> Tuple[str, str]:
+        """Pop the collection recorded when the command started."""
+        with self._lock:
+            collection = self._pending.pop((event.request_id, event.connection_id), "")
+        return collection, event.command_name
+
+
+# Una instancia por proceso, registrada en el cliente de MongoDB
+command_metrics = CommandMetrics()
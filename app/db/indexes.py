@@ -0,0 +1,90 @@
+"""
+Index bootstrap and query-plan verification.
+
+Each service declares its ``indexes`` and ``hot_queries``; this module applies
+them at startup and can check that every hot query is index-backed:
+
+    python -m app.db.indexes --check
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from typing import List
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from app.db.mongodb import MongoDB
+from app.modules.classrooms.service import ClassroomService
+from app.modules.courses.services import CourseService
+from app.modules.formRegisters.rollup import HoursRollup
+from app.modules.formRegisters.service import FormRegisterService
+from app.modules.teachers.services import TeacherService
+from app.modules.users.service import UserService
+
+logger = logging.getLogger(__name__)
+
+# Servicios (o colecciones auxiliares) cuyos índices se crean al iniciar la aplicación
+INDEXED_SERVICES: List[type] = [
+    UserService,
+    ClassroomService,
+    CourseService,
+    TeacherService,
+    FormRegisterService,
+    HoursRollup,
+]
+
+
+class IndexVerificationError(RuntimeError):
+    """Raised when a registered hot query is resolved with a collection scan."""
+
+
+async def ensure_indexes(db: AsyncIOMotorDatabase) -> None:
+    """
+    Create the declared indexes for every registered service.
+
+    :param db: Database instance.
+    """
+    for service_class in INDEXED_SERVICES:
+        service = service_class(db)
+        names = await service.ensure_indexes()
+        logger.info("Indexes ready on %s: %s", service.collection.name, ", ".join(names))
+
+
+async def verify_indexes(db: AsyncIOMotorDatabase) -> None:
+    """
+    Explain every registered hot query and fail on collection scans.
+
+    :param db: Database instance.
+    :raises IndexVerificationError: If any hot query plan is a COLLSCAN.
+    """
+    offenders = []
+    for service_class in INDEXED_SERVICES:
+        offenders.extend(await service_class(db).find_collection_scans())
+    if offenders:
+        raise IndexVerificationError(
+            "Hot queries resolved with COLLSCAN: " + ", ".join(offenders))
+    logger.info("All hot queries are index-backed")
+
+
+async def _main(check: bool) -> int:
+    """Apply the indexes and optionally verify the query plans."""
+    await MongoDB.connect()
+    try:
+        db = MongoDB.get_database()
+        await ensure_indexes(db)
+        if check:
+            await verify_indexes(db)
+    except IndexVerificationError as exc:
+        logger.error("%s", exc)
+        return 1
+    finally:
+        await MongoDB.close()
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create MongoDB indexes")
+    parser.add_argument(
+        "--check", action="store_true",
+        help="explain every hot query and exit non-zero on a COLLSCAN")
+    sys.exit(asyncio.run(_main(parser.parse_args().check)))
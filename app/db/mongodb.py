@@ -2,6 +2,8 @@
 from typing import Optional
 import logging
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from app.db.command_metrics import command_metrics
+from app.db.pool_metrics import pool_metrics
 from app.settings.settings import Settings
 
 
@@ -25,10 +27,20 @@ class MongoDB:
         """
         if cls.client is None:
             settings = Settings()  # Instancia de Settings para obtener variables
+            # Las opciones sin valor se omiten para usar el valor por defecto del driver
+            pool_options = {
+                "serverSelectionTimeoutMS": settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+                "maxPoolSize": settings.MONGO_MAX_POOL_SIZE,
+                "minPoolSize": settings.MONGO_MIN_POOL_SIZE,
+                "maxIdleTimeMS": settings.MONGO_MAX_IDLE_TIME_MS,
+                "waitQueueTimeoutMS": settings.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+                "compressors": settings.MONGO_COMPRESSORS,
+            }
             try:
                 cls.client = AsyncIOMotorClient(
                     settings.MONGO_URI,
-                    serverSelectionTimeoutMS=5000
+                    event_listeners=[pool_metrics, command_metrics],
+                    **{name: value for name, value in pool_options.items() if value is not None},
                 )
 
                 # Verify connection
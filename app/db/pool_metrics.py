@@ -0,0 +1,102 @@
+"""
+Connection pool metrics collected from PyMongo CMAP events.
+
+Motor runs PyMongo operations on worker threads, so the listener updates its
+counters under a lock.
+"""
+
+import threading
+from collections import Counter
+from typing import Any, Dict
+from pymongo import monitoring
+from app.utils.metrics import LatencyStats
+
+
+class PoolMetrics(monitoring.ConnectionPoolListener):
+    """Tracks checked-out connections, checkout wait time and connection churn."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checked_out = 0
+        self.max_checked_out = 0
+        self.open_connections = 0
+        self.created = 0
+        self.closed = 0
+        self.closed_reasons: Counter = Counter()
+        self.checkout_failures: Counter = Counter()
+        self.pool_clears = 0
+        self.checkout_wait = LatencyStats()
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        pass
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        pass
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        with self._lock:
+            self.pool_clears += 1
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        pass
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        with self._lock:
+            self.created += 1
+            self.open_connections += 1
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        pass
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        with self._lock:
+            self.closed += 1
+            self.open_connections -= 1
+            self.closed_reasons[event.reason] += 1
+
+    def connection_check_out_started(self, event: monitoring.ConnectionCheckOutStartedEvent) -> None:
+        pass
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent) -> None:
+        with self._lock:
+            self.checkout_failures[event.reason] += 1
+            self._observe_wait(event)
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        with self._lock:
+            self.checked_out += 1
+            self.max_checked_out = max(self.max_checked_out, self.checked_out)
+            self._observe_wait(event)
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        with self._lock:
+            self.checked_out -= 1
+
+    def _observe_wait(self, event: Any) -> None:
+        """Record the time spent waiting for a connection (PyMongo 4.7+ reports it)."""
+        duration = getattr(event, "duration", None)
+        if duration is not None:
+            self.checkout_wait.observe(duration)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the pool counters.
+
+        :return: In-use and open connections, churn, checkout failures and wait time.
+        """
+        with self._lock:
+            return {
+                "checked_out": self.checked_out,
+                "max_checked_out": self.max_checked_out,
+                "open_connections": self.open_connections,
+                "created": self.created,
+                "closed": self.closed,
+                "closed_reasons": dict(self.closed_reasons),
+                "checkout_failures": dict(self.checkout_failures),
+                "pool_clears": self.pool_clears,
+                "checkout_wait": self.checkout_wait.stats(),
+            }
+
+
+# Una instancia por proceso, registrada en el cliente de MongoDB
+pool_metrics = PoolMetrics()
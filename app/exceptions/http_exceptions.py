@@ -41,6 +41,27 @@ class DuplicateResourceException(BaseAPIException):
             details={"resource": resource, "field": field, "value": value}
         )
 
+class BadRequestException(BaseAPIException):
+    """Exception for malformed client input"""
+    def __init__(self, message: str, error_code: str = "BAD_REQUEST",
+                 details: Optional[Dict[str, Any]] = None):
+        super().__init__(
+            status_code=400,
+            message=message,
+            error_code=error_code,
+            details=details
+        )
+
+class ServiceUnavailableException(BaseAPIException):
+    """Exception for requests rejected because the server is saturated"""
+    def __init__(self, resource: str):
+        super().__init__(
+            status_code=503,
+            message=f"{resource} is saturated, retry later",
+            error_code="SERVICE_UNAVAILABLE",
+            details={"resource": resource}
+        )
+
 class UnauthorizedException(HTTPException):
     """
     Exception raised for unauthorized access or invalid authentication credentials.
@@ -3,21 +3,37 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.db.dependencies import get_database
+from app.db.indexes import ensure_indexes, verify_indexes
 from app.db.mongodb import MongoDB
 from app.middlewares.auth_middleware import JWTAuthMiddleware
-from app.middlewares.error_handler import error_handler_middleware
+from app.middlewares.error_handler import ErrorHandlerMiddleware
+from app.middlewares.timing_middleware import TimingMiddleware
 from app.modules.users.routes import router as auth_router
 from app.modules.classrooms.routes import router as classroom_router
 from app.modules.teachers.routes import teacher_router
+from app.modules.teachers.services import TeacherService
 from app.modules.courses.routes import course_router
+from app.modules.courses.services import CourseService
 from app.modules.formRegisters.routes import form_router
+from app.modules.metrics.routes import metrics_router
+from app.settings.settings import settings
+from app.utils.constants import (
+    NEXT_CURSOR_HEADER, TOTAL_COUNT_ESTIMATE_HEADER, TOTAL_COUNT_HEADER)
+from app.utils.security import shutdown_hash_executor
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):  # Cambié 'app' por '_app' para evitar redefinición
     """Handles the startup and shutdown events"""
     await MongoDB.connect()  # Initialize MongoDB connection
+    await ensure_indexes(MongoDB.get_database())
+    if settings.MONGO_VERIFY_INDEXES:
+        await verify_indexes(MongoDB.get_database())
+    # Índices de prefijos de /suggest, para que la primera consulta no espere la carga
+    await TeacherService(MongoDB.get_database()).load_suggestions()
+    await CourseService(MongoDB.get_database()).load_suggestions()
     yield
     await MongoDB.close()  # Close MongoDB connection on shutdown
+    shutdown_hash_executor()
 
 # Initialize FastAPI app
 app = FastAPI(  # Cambié 'app' por 'api_app'
@@ -33,12 +49,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*", "Authorization"],  # Asegúrate de incluir Authorization explícitamente
-    expose_headers=["*"],
+    expose_headers=["*", NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER, TOTAL_COUNT_ESTIMATE_HEADER],
 )
 
-# Registro de middlewares
-app.middleware("http")(error_handler_middleware)
-
 # Add JWT authentication middleware with dependency injection
 app.add_middleware(
     JWTAuthMiddleware,
@@ -52,9 +65,16 @@ app.add_middleware(
     }
 )
 
+# Registro de middlewares (el último registrado es el más externo, así también
+# formatea los errores de autenticación)
+app.add_middleware(ErrorHandlerMiddleware)
+# Mide la latencia por ruta incluyendo las respuestas de error (Server-Timing)
+app.add_middleware(TimingMiddleware)
+
 # Registro de rutas
 app.include_router(auth_router)
 app.include_router(classroom_router)
 app.include_router(teacher_router)
 app.include_router(course_router)
 app.include_router(form_router)
+app.include_router(metrics_router)
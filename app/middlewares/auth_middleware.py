@@ -5,26 +5,27 @@ Handles token verification and user authentication using dependency injection.
 
 import logging
 from typing import Callable
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 from fastapi import Request, HTTPException
 from fastapi.security import HTTPBearer
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from app.modules.users.service import UserService
 from app.utils.security import decode_access_token
+from app.utils.timing import timed
 from app.db.dependencies import get_database
 
 
 logger = logging.getLogger(__name__)
 
-class JWTAuthMiddleware(BaseHTTPMiddleware):
+class JWTAuthMiddleware:
     """
-    Middleware to enforce authentication on protected routes.
+    Pure ASGI middleware to enforce authentication on protected routes.
     Uses FastAPI dependency injection for database access.
     """
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         db_dependency: Callable[[], AsyncIOMotorDatabase] = get_database,
         exclude_paths: set[str] = None
     ):
@@ -35,7 +36,7 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
         :param db_dependency: Callable that returns database connection
         :param exclude_paths: Set of paths to exclude from authentication
         """
-        super().__init__(app)
+        self.app = app
         self.security = HTTPBearer()
         self.db_dependency = db_dependency
         self.exclude_paths = exclude_paths or {
@@ -46,21 +47,40 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
             "/openapi.json"
         }
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process each request through the middleware.
-        
-        :param request: The incoming request
-        :param call_next: The next middleware/route handler
-        :return: The response
+
+        :param scope: The ASGI connection scope
+        :param receive: The ASGI receive channel
+        :param send: The ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         # Check if the path should be excluded from authentication
-        if request.url.path in self.exclude_paths:
-            return await call_next(request)
+        if scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
         # Excluir solicitudes OPTIONS del middleware de autenticación
-        if request.method == "OPTIONS":
-            return await call_next(request)
+        if scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
 
+        request = Request(scope)
+        # Add user to request state
+        request.state.user = await self.authenticate(request)
+        # Continue with the request
+        await self.app(scope, receive, send)
+
+    async def authenticate(self, request: Request):
+        """
+        Resolve the active user for the bearer token of a request.
+
+        :param request: The incoming request
+        :return: The authenticated user
+        :raises HTTPException: If the token or the user is not valid
+        """
         try:
             # Get token from header
             auth_header = request.headers.get("Authorization")
@@ -77,7 +97,8 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
 
             try:
                 # Decode and validate token
-                payload = decode_access_token(token)
+                with timed("jwt"):
+                    payload = decode_access_token(token)
             except Exception as exc:
                 raise HTTPException(
                     status_code=401,
@@ -88,7 +109,8 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
             db = await self.db_dependency()
             # Get user from database
             user_service = UserService(db)
-            user = await user_service.get_by_id(payload["sub"])
+            with timed("user"):
+                user = await user_service.get_active_user(payload["sub"])
             if not user:
                 raise HTTPException(
                     status_code=401,
@@ -99,12 +121,7 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
                     status_code=401,
                     detail="User is inactive"
                 )
-
-            # Add user to request state
-            request.state.user = user
-            # Continue with the request
-            response = await call_next(request)
-            return response
+            return user
 
         except HTTPException as exc:
             raise exc
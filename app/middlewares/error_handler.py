@@ -7,25 +7,65 @@ import logging
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from app.exceptions.http_exceptions import BaseAPIException
 
 # Configuración de logging
 logger = logging.getLogger(__name__)
 
-async def error_handler_middleware(request: Request, call_next):
+class ErrorHandlerMiddleware:
     """
-    Middleware to handle exceptions and return standardized JSON responses.
+    Pure ASGI middleware to handle exceptions and return standardized JSON responses.
+    Responses are passed through untouched, so streaming bodies are not buffered.
     """
-    try:
-        return await call_next(request)
-    except BaseAPIException as exc:
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize the middleware.
+
+        :param app: The wrapped ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:  # noqa: BLE001
+            # Si la respuesta ya comenzó no se puede reemplazar
+            if response_started:
+                raise
+            response = build_error_response(Request(scope), exc)
+            await response(scope, receive, send)
+
+
+def build_error_response(request: Request, exc: Exception) -> JSONResponse:
+    """
+    Build the standardized JSON error envelope for an exception.
+
+    :param request: The request that failed.
+    :param exc: The exception raised while handling it.
+    :return: JSON response with message, error_code and details.
+    """
+    if isinstance(exc, BaseAPIException):
         # Manejo de excepciones personalizadas
         return JSONResponse(
             status_code=exc.status_code,
             content=exc.detail
         )
 
-    except HTTPException as exc:
+    if isinstance(exc, HTTPException):
         # Manejo de HTTPException (errores nativos de FastAPI)
         return JSONResponse(
             status_code=exc.status_code,
@@ -36,7 +76,7 @@ async def error_handler_middleware(request: Request, call_next):
             }
         )
 
-    except (ValueError, TypeError, KeyError) as exc:
+    if isinstance(exc, (ValueError, TypeError, KeyError)):
         # Captura de excepciones específicas de Python
         logger.warning("Application error: %s", exc)
         return JSONResponse(
@@ -48,14 +88,13 @@ async def error_handler_middleware(request: Request, call_next):
             }
         )
 
-    except Exception as exc:  # noqa: BLE001
-        # Captura de errores inesperados con logging seguro
-        logger.error("Unhandled exception: %s", exc, exc_info=True)
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
-                "message": "Internal server error",
-                "error_code": "INTERNAL_SERVER_ERROR",
-                "details": {"method": request.method, "url": str(request.url)}
-            }
-        )
+    # Captura de errores inesperados con logging seguro
+    logger.error("Unhandled exception: %s", exc, exc_info=exc)
+    return JSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={
+            "message": "Internal server error",
+            "error_code": "INTERNAL_SERVER_ERROR",
+            "details": {"method": request.method, "url": str(request.url)}
+        }
+    )
@@ -0,0 +1,67 @@
+"""
+Request latency middleware: per-route histograms and the Server-Timing header.
+"""
+
+import time
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.utils.metrics import Histogram
+from app.utils.timing import RequestTimings, request_timings
+
+request_duration = Histogram(
+    "http_request_duration_seconds",
+    "Duration of HTTP requests by method, route template and status code.",
+    ("method", "route", "status"),
+)
+
+# Etiqueta de las solicitudes que no coinciden con ninguna ruta (evita una serie por URL)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class TimingMiddleware:
+    """
+    Pure ASGI middleware that times every HTTP request.
+
+    Must be the outermost middleware so it sees the final status code, including
+    the error responses built by ErrorHandlerMiddleware.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize the middleware.
+
+        :param app: The wrapped ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = request_timings.set(timings)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                now = time.perf_counter()
+                timings.response_started(now)
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", timings.header(now - start))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_timings.reset(token)
+            # El router deja la ruta encontrada en el scope; se usa su plantilla. Las
+            # solicitudes rechazadas antes del enrutamiento (p. ej. por JWTAuthMiddleware)
+            # quedan como UNMATCHED_ROUTE con su código de estado
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            request_duration.observe(
+                (scope["method"], route, str(status_code)), time.perf_counter() - start)
+
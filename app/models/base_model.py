@@ -4,8 +4,12 @@ for all domain models in the application.
 """
 
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from typing import Generic, List, Optional, Type, TypeVar
+from pydantic import BaseModel, Field, create_model
+from app.settings.settings import settings
+
+T = TypeVar("T", bound=BaseModel)
 
 class AuditFields(BaseModel):
     """Base audit fields that should be included in all models"""
@@ -18,3 +22,27 @@ class AuditFields(BaseModel):
 class MongoBaseModel(BaseModel):
     """Base model with MongoDB id field"""
     id: Optional[str] = Field(None, alias="_id")
+
+class BatchRequest(BaseModel):
+    """IDs to fetch in a single batch request"""
+    ids: List[str] = Field(..., min_length=1, max_length=settings.BATCH_MAX_IDS)
+
+class BatchResponse(BaseModel, Generic[T]):
+    """Documents found, in request order, and the IDs that were not found"""
+    items: List[T]
+    missing: List[str]
+
+@lru_cache(maxsize=None)
+def partial_model(model: Type[BaseModel]) -> Type[BaseModel]:
+    """
+    Build (once per model) a variant of a model where every field is optional,
+    used to validate documents read with a projection.
+
+    :param model: The complete model.
+    :return: Subclass of the model with all fields defaulting to None.
+    """
+    fields = {
+        name: (Optional[info.annotation], Field(None, alias=info.alias))
+        for name, info in model.model_fields.items()
+    }
+    return create_model(f"{model.__name__}Partial", __base__=model, **fields)
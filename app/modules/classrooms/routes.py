@@ -1,16 +1,21 @@
 """Classrooms routes"""
 
-from typing import List
-from fastapi import APIRouter, Depends, Path
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Path, Query, Response
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from app.db.dependencies import get_database
 from app.exceptions.http_exceptions import NotFoundException
+from app.models.base_model import BatchRequest, BatchResponse
 from app.modules.classrooms.models import Classroom, ClassroomCreate, ClassroomUpdate
 from app.modules.classrooms.service import ClassroomService
+from app.settings.settings import settings
+from app.utils.fields import partial_response
+from app.utils.pagination import page_headers, set_page_headers
 from app.utils.security import check_admin_role, check_teacher_role
+from app.utils.timing import TimedRoute
 
 
-router = APIRouter(prefix="/classrooms", tags=["classrooms"])
+router = APIRouter(prefix="/classrooms", tags=["classrooms"], route_class=TimedRoute)
 
 def get_classroom_service(db: AsyncIOMotorDatabase = Depends(get_database)) -> ClassroomService:
     """Dependency to provide ClassroomService"""
@@ -28,21 +33,47 @@ async def create_classroom(
 @router.get("/{classroom_id}", response_model=Classroom)
 async def get_classroom(
     classroom_id: str = Path(..., title="The ID of the classroom to get"),
+    fields: Optional[str] = None,
     service: ClassroomService = Depends(get_classroom_service),
     user: str = Depends(check_admin_role),
 ):
     """Get a specific classroom by ID"""
-    return await service.get_by_id_or_raise(classroom_id, "Classroom")
+    selected = service.parse_fields(fields)
+    classroom = await service.get_by_id_or_raise(classroom_id, "Classroom", selected)
+    if selected:
+        return partial_response(classroom, selected)
+    return classroom
 
 @router.get("/", response_model=List[Classroom])
 async def list_classrooms(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=settings.LIST_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    estimate: bool = False,
     service: ClassroomService = Depends(get_classroom_service),
     user: str = Depends(check_teacher_role),
 ):
     """List all classrooms with pagination"""
-    return await service.get_all(skip, limit)
+    selected = service.parse_fields(fields)
+    items, next_cursor = await service.get_page(skip, limit, cursor, fields=selected)
+    # El estimado cuenta también los documentos desactivados: solo si el cliente lo pide
+    total = await service.count(estimated=estimate)
+    if selected:
+        return partial_response(items, selected, page_headers(next_cursor, total, estimate))
+    set_page_headers(response, next_cursor, total, estimate)
+    return items
+
+@router.post("/batch", response_model=BatchResponse[Classroom])
+async def get_classrooms_batch(
+    data: BatchRequest,
+    service: ClassroomService = Depends(get_classroom_service),
+    user: str = Depends(check_admin_role),
+):
+    """Get several classrooms by ID in one request"""
+    items, missing = await service.get_many(data.ids)
+    return BatchResponse[Classroom](items=items, missing=missing)
 
 @router.put("/{classroom_id}", response_model=Classroom)
 async def update_classroom(
@@ -61,7 +92,7 @@ async def delete_classroom(
     user: str = Depends(check_admin_role),
 ):
     """Soft delete a classroom"""
-    success = await service.delete_classroom(classroom_id, user)
+    success = await service.delete_classroom(classroom_id, user.identification_number)
     if not success:
         raise NotFoundException("Classroom", classroom_id)
     return {"message": "Classroom is disabled"}
@@ -6,13 +6,23 @@ from typing import List
 from bson import ObjectId
 from fastapi import HTTPException
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from app.exceptions.http_exceptions import DuplicateResourceException
+from app.exceptions.http_exceptions import DuplicateResourceException, NotFoundException
 from app.modules.classrooms.models import Classroom, ClassroomCreate, ClassroomUpdate
-from app.utils.crud_base import CRUDBase
+from pymongo import ASCENDING, IndexModel
+from app.utils.crud_base import ACTIVE_ONLY, CRUDBase, HotQuery, entity_cache
 
 class ClassroomService(CRUDBase[Classroom]):
     """Service layer for handling Classroom-related operations."""
 
+    indexes = CRUDBase.indexes + [
+        IndexModel([("code", ASCENDING)], name="code_active",
+                   partialFilterExpression=ACTIVE_ONLY),
+    ]
+    hot_queries = CRUDBase.hot_queries + [
+        HotQuery("duplicate_code", {"code": "", "is_active": True}),
+    ]
+    cache = entity_cache("classrooms")
+
     def __init__(self, db: AsyncIOMotorDatabase):
         """Initialize the service with the 'classrooms' collection."""
         super().__init__(db, "classrooms", Classroom)
@@ -27,35 +37,36 @@ class ClassroomService(CRUDBase[Classroom]):
     async def get_all_classrooms(self, skip: int = 0, limit: int = 100) -> List[Classroom]:
         """Retrieve a list of all classrooms with pagination."""
 
-        return [Classroom(**classroom) for classroom in await super().get_all(skip, limit)]
+        return await super().get_all(skip, limit)
 
     async def update_classroom(
         self, classroom_id: str, data: ClassroomUpdate, updated_by: str
     ) -> Classroom:
-        """Update a classroom with duplicate code validation."""
+        """
+        Update a classroom with duplicate code validation.
+
+        A ``code`` in the request is always checked against the other active classrooms,
+        even when it is unchanged. The updated classroom is returned even when the update
+        disables it (``is_active: False``).
+        """
 
         try:
             obj_id = ObjectId(classroom_id)
         except Exception as exc:
             raise HTTPException(status_code=400, detail="Invalid classroom ID format") from exc
 
-        classroom = await self.get_by_id_or_raise(classroom_id, "Classroom")
+        if data.code:
+            await self._check_duplicate_code(data.code, exclude_id=obj_id)
 
+        classroom = await self.update(
+            classroom_id, data.model_dump(exclude_unset=True), updated_by)
         if not classroom:
-            raise HTTPException(status_code=404, detail="Classroom not found")
-
-        if data.code and data.code != classroom.code:
-            await self._check_duplicate_code(data.code, exclude_id=classroom.id)
-
-        await self.update(obj_id, data.model_dump(exclude_unset=True), updated_by)
-
-        return await self.get_by_id_or_raise(classroom_id, "Classroom")
+            raise NotFoundException("Classroom", classroom_id)
+        return classroom
 
     async def delete_classroom(self, classroom_id: str, deleted_by: str) -> bool:
         """Soft delete (disable) a classroom by setting `is_active` to False."""
 
-        await self.get_by_id_or_raise(classroom_id, "Classroom")
-
         return await super().delete(classroom_id, deleted_by)
 
     async def _check_duplicate_code(self, code: str, exclude_id: ObjectId = None) -> None:
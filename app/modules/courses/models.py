@@ -26,6 +26,12 @@ class CourseUpdate(CourseBase):
     description: str | None = None
     is_active: bool
 
+class CourseSuggestion(BaseModel):
+    """Autocomplete entry for a course"""
+    id: str
+    code: str
+    name: str
+
 class CourseResponse(CourseBase):
     """Response model for Course with string _id"""
     id: str = Field(alias="_id")
@@ -1,15 +1,20 @@
 """Courses routes"""
 
-from typing import List
-from fastapi import APIRouter, Depends, Path
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Path, Query, Response
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from app.db.dependencies import get_database
 from app.exceptions.http_exceptions import NotFoundException
-from app.modules.courses.models import Course, CourseCreate, CourseUpdate
+from app.models.base_model import BatchRequest, BatchResponse
+from app.modules.courses.models import Course, CourseCreate, CourseSuggestion, CourseUpdate
 from app.modules.courses.services import CourseService
+from app.settings.settings import settings
+from app.utils.fields import partial_response
+from app.utils.pagination import page_headers, set_page_headers
 from app.utils.security import check_admin_role, check_teacher_role
+from app.utils.timing import TimedRoute
 
-course_router = APIRouter(prefix="/courses", tags=["courses"])
+course_router = APIRouter(prefix="/courses", tags=["courses"], route_class=TimedRoute)
 
 def get_course_service(db: AsyncIOMotorDatabase = Depends(get_database)) -> CourseService:
     """Dependency to provide CourseService"""
@@ -25,24 +30,60 @@ async def create_course(
     """Create a new course"""
     return await service.create_course(data, user.identification_number)
 
+@course_router.get("/suggest", response_model=List[CourseSuggestion])
+async def suggest_courses(
+    prefix: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=settings.SUGGEST_MAX_LIMIT),
+    service: CourseService = Depends(get_course_service),
+    user: str = Depends(check_teacher_role),
+):
+    """Courses whose code or name starts with the prefix"""
+    return await service.suggest(prefix, limit)
+
 @course_router.get("/{course_id}", response_model=Course)
 async def get_course(
     course_id: str = Path(..., title="The ID of the course to get"),
+    fields: Optional[str] = None,
     service: CourseService = Depends(get_course_service),
     user: str = Depends(check_admin_role),
 ):
     """Get a specific course by ID"""
-    return await service.get_by_id_or_raise(course_id, "Course")
+    selected = service.parse_fields(fields)
+    course = await service.get_by_id_or_raise(course_id, "Course", selected)
+    if selected:
+        return partial_response(course, selected)
+    return course
 
 @course_router.get("/", response_model=List[Course])
 async def list_courses(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=settings.LIST_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    estimate: bool = False,
     service: CourseService = Depends(get_course_service),
     user: str = Depends(check_teacher_role),
 ):
     """List all courses with pagination"""
-    return await service.get_all(skip, limit)
+    selected = service.parse_fields(fields)
+    items, next_cursor = await service.get_page(skip, limit, cursor, fields=selected)
+    # El estimado cuenta también los documentos desactivados: solo si el cliente lo pide
+    total = await service.count(estimated=estimate)
+    if selected:
+        return partial_response(items, selected, page_headers(next_cursor, total, estimate))
+    set_page_headers(response, next_cursor, total, estimate)
+    return items
+
+@course_router.post("/batch", response_model=BatchResponse[Course])
+async def get_courses_batch(
+    data: BatchRequest,
+    service: CourseService = Depends(get_course_service),
+    user: str = Depends(check_admin_role),
+):
+    """Get several courses by ID in one request"""
+    items, missing = await service.get_many(data.ids)
+    return BatchResponse[Course](items=items, missing=missing)
 
 @course_router.put("/{course_id}", response_model=Course)
 async def update_course(
@@ -61,7 +102,7 @@ async def delete_course(
     user: str = Depends(check_admin_role),
 ):
     """Soft delete a course"""
-    success = await service.delete_course(course_id, user)
+    success = await service.delete_course(course_id, user.identification_number)
     if not success:
         raise NotFoundException("Course", course_id)
     return {"message": "Course is disabled"}
\ No newline at end of file
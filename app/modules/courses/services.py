@@ -2,19 +2,35 @@
 Service CRUD Courses
 """
 
-from typing import List
+from typing import List, Tuple
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
 from fastapi import HTTPException
+from pymongo import ASCENDING, IndexModel
 
-from app.exceptions.http_exceptions import DuplicateResourceException
-from app.modules.courses.models import Course, CourseCreate, CourseUpdate
-from app.utils.crud_base import CRUDBase
+from app.exceptions.http_exceptions import DuplicateResourceException, NotFoundException
+from app.modules.courses.models import Course, CourseCreate, CourseSuggestion, CourseUpdate
+from app.utils.crud_base import ACTIVE_ONLY, CRUDBase, HotQuery, entity_cache
+from app.utils.prefix_index import PrefixIndex, word_suffixes
+from app.utils.suggestions import SuggestionsMixin
 
 
-class CourseService(CRUDBase[Course]):
+class CourseService(SuggestionsMixin, CRUDBase[Course]):
     """Service layer for handling Course-related operations."""
 
+    indexes = CRUDBase.indexes + [
+        IndexModel([("code", ASCENDING)], name="code_active",
+                   partialFilterExpression=ACTIVE_ONLY),
+    ]
+    hot_queries = CRUDBase.hot_queries + [
+        HotQuery("duplicate_code", {"code": "", "is_active": True}),
+    ]
+    cache = entity_cache("courses")
+
+    # Autocompletado por código o por cualquier palabra del nombre
+    suggestions = PrefixIndex()
+    suggestion_fields = ("code", "name")
+
     def __init__(self, db: AsyncIOMotorDatabase):
         """Initialize CourseService with database connection."""
         super().__init__(db, "courses", Course)
@@ -26,34 +42,41 @@ class CourseService(CRUDBase[Course]):
 
     async def get_all_courses(self, skip: int = 0, limit: int = 100) -> List[Course]:
         """Retrieve all courses with pagination."""
-        return [Course(**course) for course in await super().get_all(skip, limit)]
+        return await super().get_all(skip, limit)
 
     async def update_course(self, course_id: str, data: CourseUpdate, updated_by: str) -> Course:
-        """Update a course with duplicate code validation."""
+        """
+        Update a course with duplicate code validation.
+
+        A ``code`` in the request is always checked against the other active courses,
+        even when it is unchanged. The updated course is returned even when the update
+        disables it (``is_active: False``).
+        """
 
         try:
             obj_id = ObjectId(course_id)
         except Exception as exc:
             raise HTTPException(status_code=400, detail="Invalid course ID format") from exc
 
-        course = await self.get_by_id_or_raise(course_id, "Course")
+        if data.code:
+            await self._check_duplicate_code(data.code, exclude_id=obj_id)
 
+        course = await self.update(course_id, data.model_dump(exclude_unset=True), updated_by)
         if not course:
-            raise HTTPException(status_code=404, detail="Course not found")
-
-        if data.code and data.code != course.code:
-            await self._check_duplicate_code(data.code, exclude_id=course.id)
-
-        await self.update(obj_id, data.model_dump(exclude_unset=True), updated_by)
-
-        return await self.get_by_id_or_raise(course_id, "Course")
+            raise NotFoundException("Course", course_id)
+        return course
 
     async def delete_course(self, course_id: str, deleted_by: str) -> bool:
         """Disable a course instead of deleting it permanently."""
-        await self.get_by_id_or_raise(course_id, "Course")
         return await super().delete(course_id, deleted_by)
 
-    async def _check_duplicate_code(self, code: str, exclude_id: str = None) -> None:
+    def _suggestion(self, document: dict) -> Tuple[CourseSuggestion, List[str]]:
+        """Index a course by code and by any word of its name."""
+        suggestion = CourseSuggestion(
+            id=str(document["_id"]), code=document["code"], name=document["name"])
+        return suggestion, [suggestion.code, *word_suffixes(suggestion.name)]
+
+    async def _check_duplicate_code(self, code: str, exclude_id: ObjectId = None) -> None:
         """Check if a course with the given code already exists."""
         query = {"code": code, "is_active": True}
 
@@ -0,0 +1,94 @@
+"""
+Migration of form register dates and times stored as text to BSON dates.
+
+    python -m app.modules.formRegisters.migrate_dates [--batch-size 1000] [--dry-run]
+
+Documents whose values cannot be parsed are left untouched and reported.
+When any ``fecha`` changes, the hours rollup is rebuilt afterwards, since its
+periods are derived from that field.
+"""
+
+import argparse
+import asyncio
+import logging
+from typing import List
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from app.db.mongodb import MongoDB
+from app.modules.formRegisters.models import TIME_FIELDS
+from app.modules.formRegisters.rollup import HoursRollup
+from app.utils.dates import parse_date, parse_time
+
+logger = logging.getLogger(__name__)
+
+DATE_FIELDS = ("fecha",) + TIME_FIELDS
+
+
+async def migrate_dates(
+    db: AsyncIOMotorDatabase, batch_size: int = 1000, dry_run: bool = False
+) -> List[str]:
+    """
+    Convert text dates and times of ``form_registers`` in batches.
+
+    :param db: Database instance.
+    :param batch_size: Documents updated per bulk write.
+    :param dry_run: Only count the documents that would change.
+    :return: IDs of the documents that could not be parsed.
+    """
+    collection = db["form_registers"]
+    query = {"$or": [{field: {"$type": "string"}} for field in DATE_FIELDS]}
+    projection = {field: 1 for field in DATE_FIELDS}
+
+    operations, failed, migrated, fechas = [], [], 0, 0
+    async for document in collection.find(query, projection).batch_size(batch_size):
+        try:
+            changes = {
+                field: parse_date(document[field]) if field == "fecha"
+                else parse_time(document[field])
+                for field in DATE_FIELDS
+                if isinstance(document.get(field), str)
+            }
+        except ValueError as exc:
+            logger.warning("Form %s not migrated: %s", document["_id"], exc)
+            failed.append(str(document["_id"]))
+            continue
+
+        fechas += "fecha" in changes
+        operations.append(UpdateOne({"_id": document["_id"]}, {"$set": changes}))
+        if len(operations) == batch_size:
+            migrated += await _flush(collection, operations, dry_run)
+            operations = []
+    migrated += await _flush(collection, operations, dry_run)
+
+    logger.info("%s %d forms, %d failed",
+                "Would migrate" if dry_run else "Migrated", migrated, len(failed))
+    if fechas and not dry_run:
+        # Los formularios migrados pueden haber caído en un periodo distinto del rollup
+        await HoursRollup(db).rebuild()
+    elif fechas:
+        logger.info("%d forms change fecha: the hours rollup would be rebuilt", fechas)
+    return failed
+
+
+async def _flush(collection, operations: List[UpdateOne], dry_run: bool) -> int:
+    """Send a batch of updates unless running dry."""
+    if operations and not dry_run:
+        await collection.bulk_write(operations, ordered=False)
+    return len(operations)
+
+
+async def _main(batch_size: int, dry_run: bool) -> None:
+    """Run the migration against the configured database."""
+    await MongoDB.connect()
+    try:
+        await migrate_dates(MongoDB.get_database(), batch_size, dry_run)
+    finally:
+        await MongoDB.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert form dates stored as text")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(_main(args.batch_size, args.dry_run))
@@ -1,11 +1,16 @@
-from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field, field_serializer, field_validator
 from app.models.base_model import MongoBaseModel, AuditFields
+from app.utils.dates import format_date, format_time, parse_date, parse_stored, parse_time
 from app.utils.mongo import convert_object_id
 
+TIME_FIELDS = ("horaEntrada", "horaSalida", "horaRegistroEntrada")
+
 class FormRegisterBase(BaseModel):
     """Base fields for FormRegister"""
     dia: str = Field(..., min_length=1)
-    fecha: str = Field(..., min_length=1)
+    fecha: datetime
     jornada: str
     aula: str = Field(..., min_length=1)
     nombre: str = Field(..., min_length=1)
@@ -13,14 +18,49 @@ class FormRegisterBase(BaseModel):
     cedula: str = Field(..., min_length=5, max_length=20)
     modulo: str = Field(..., min_length=1)
     contenido: str = Field(..., min_length=1)
-    horaEntrada: str = Field(..., min_length=1)
-    horaSalida: str = Field(..., min_length=1)
+    horaEntrada: datetime
+    horaSalida: datetime
     cantidadHoras: float
-    horaRegistroEntrada: str | None
+    horaRegistroEntrada: datetime | None
     direccion: str | None
 
+    # Se aceptan los formatos de texto existentes y se guardan como fechas BSON
+    @field_validator("fecha", mode="before")
+    @classmethod
+    def _parse_fecha(cls, value):
+        return parse_date(value)
+
+    @field_validator(*TIME_FIELDS, mode="before")
+    @classmethod
+    def _parse_horas(cls, value):
+        return parse_time(value)
+
+    # En JSON se mantiene el formato de texto que ya consumen los clientes
+    @field_serializer("fecha", when_used="json-unless-none")
+    def _format_fecha(self, value: datetime) -> str:
+        return format_date(value)
+
+    @field_serializer(*TIME_FIELDS, when_used="json-unless-none")
+    def _format_horas(self, value: datetime) -> str:
+        return format_time(value)
+
 class FormRegister(FormRegisterBase, MongoBaseModel, AuditFields):
     """Complete FormRegister model"""
+    # Lo que migrate_dates no pudo convertir sigue guardado como texto y se devuelve tal cual
+    fecha: datetime | str
+    horaEntrada: datetime | str
+    horaSalida: datetime | str
+    horaRegistroEntrada: datetime | str | None
+
+    @field_validator("fecha", mode="before")
+    @classmethod
+    def _parse_fecha(cls, value):
+        return parse_stored(parse_date, value)
+
+    @field_validator(*TIME_FIELDS, mode="before")
+    @classmethod
+    def _parse_horas(cls, value):
+        return parse_stored(parse_time, value)
 
 class FormRegisterCreate(FormRegisterBase):
     """Schema for creating a FormRegister entry"""
@@ -28,7 +68,7 @@ class FormRegisterCreate(FormRegisterBase):
 class FormRegisterUpdate(FormRegisterBase):
     """Schema for updating a FormRegister entry"""
     dia: str | None = None
-    fecha: str | None = None
+    fecha: datetime | None = None
     jornada: str | None = None
     aula: str | None = None
     nombre: str | None = None
@@ -36,11 +76,11 @@ class FormRegisterUpdate(FormRegisterBase):
     cedula: str | None = None
     modulo: str | None = None
     contenido: str | None = None
-    horaEntrada: str | None = None
-    horaSalida: str | None = None
-    cantidadHoras: str | None = None
+    horaEntrada: datetime | None = None
+    horaSalida: datetime | None = None
+    cantidadHoras: float | None = None
     registroSalida: bool | None = None
-    horaRegistroEntrada: str | None = None
+    horaRegistroEntrada: datetime | None = None
     direccion: str | None = None
 
 class FormRegisterResponse(FormRegisterBase):
@@ -51,3 +91,32 @@ class FormRegisterResponse(FormRegisterBase):
     def from_mongo(cls, data: dict):
         """Convert ObjectId to string in the response"""
         return cls(**convert_object_id(data))
+
+class HoursReportRow(BaseModel):
+    """Total hours of a teacher for a module (and period, when grouped by month)"""
+    cedula: str
+    modulo: str
+    periodo: Optional[str] = None
+    nombre: Optional[str] = None
+    apellido: Optional[str] = None
+    totalHoras: float
+    registros: int
+
+# Columnas de la exportación CSV/NDJSON
+FORM_REGISTER_EXPORT_FIELDS = ["_id", *FormRegisterBase.model_fields,
+                               "created_at", "created_by", "updated_at", "updated_by"]
+# Las fechas y horas se exportan con el mismo formato de texto que la API
+FORM_REGISTER_EXPORT_FORMATTERS = {"fecha": format_date, **dict.fromkeys(TIME_FIELDS, format_time)}
+
+class FormRegisterBulkItemResult(BaseModel):
+    """Outcome of one item of a bulk submission"""
+    index: int
+    status: str
+    id: Optional[str] = None
+    errors: Optional[List[Dict[str, Any]]] = None
+
+class FormRegisterBulkResponse(BaseModel):
+    """Response model for a bulk submission"""
+    inserted: int
+    failed: int
+    results: List[FormRegisterBulkItemResult]
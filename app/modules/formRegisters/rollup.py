@@ -0,0 +1,246 @@
+"""
+Incrementally maintained hours rollup per (cedula, modulo, year-month).
+
+FormRegisterService applies ``$inc`` deltas on every create, update and soft
+delete, so monthly totals are read without scanning ``form_registers``. If the
+rollup ever drifts (e.g. a write failed between both collections) it can be
+recomputed from scratch:
+
+    python -m app.modules.formRegisters.rollup --rebuild
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, IndexModel, UpdateOne
+from app.db.mongodb import MongoDB
+from app.modules.formRegisters.models import HoursReportRow
+from app.utils.crud_base import HotQuery, find_collection_scans
+from app.utils.dates import DATE_FORMATS, parse_date, parse_stored
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_COLLECTION = "form_hours_rollup"
+
+RollupKey = Tuple[str, str, str]
+
+def _text_date(date_format: Optional[str]) -> dict:
+    """Aggregation expression parsing a text ``fecha`` with one format, null if it does not match."""
+    parse = {"dateString": {"$trim": {"input": "$fecha"}}, "onError": None, "onNull": None}
+    if date_format:
+        parse["format"] = date_format
+    return {"$dateFromString": parse}
+
+
+def _first_not_null(expressions: List[dict]) -> dict:
+    """Nest ``$ifNull`` so the first non-null expression wins."""
+    if len(expressions) == 1:
+        return expressions[0]
+    return {"$ifNull": [expressions[0], _first_not_null(expressions[1:])]}
+
+
+# Año-mes de fecha en una etapa de agregación; los documentos aún no migrados (texto) se
+# interpretan con los mismos formatos que parse_date, y queda null si ninguno aplica
+PERIOD_EXPRESSION = {"$dateToString": {"format": "%Y-%m", "date": {"$cond": [
+    {"$eq": [{"$type": "$fecha"}, "date"]},
+    "$fecha",
+    {"$cond": [
+        {"$eq": [{"$type": "$fecha"}, "string"]},
+        _first_not_null([_text_date(fmt) for fmt in DATE_FORMATS] + [_text_date(None)]),
+        None,
+    ]},
+]}}}
+
+
+def period_of(fecha: Any) -> Optional[str]:
+    """
+    Return the year-month (YYYY-MM) of a form date.
+
+    :param fecha: The ``fecha`` value, as datetime or text in any format parse_date accepts.
+    :return: The period, or None if it cannot be derived.
+    """
+    parsed = parse_stored(parse_date, fecha)
+    if isinstance(parsed, datetime):
+        return parsed.strftime("%Y-%m")
+    return None
+
+
+def _hours(document: dict) -> float:
+    """Return cantidadHoras as a number, treating bad values as zero."""
+    try:
+        return float(document.get("cantidadHoras") or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _key(document: dict) -> Optional[RollupKey]:
+    """Return the rollup key of a form document."""
+    periodo = period_of(document.get("fecha"))
+    if not periodo or not document.get("cedula") or not document.get("modulo"):
+        return None
+    return document["cedula"], document["modulo"], periodo
+
+
+class HoursRollup:
+    """Access to the ``form_hours_rollup`` collection."""
+
+    indexes = [
+        IndexModel([("periodo", ASCENDING), ("cedula", ASCENDING), ("modulo", ASCENDING)],
+                   name="periodo_cedula_modulo", unique=True),
+    ]
+    hot_queries = [
+        HotQuery("period", {"periodo": ""}),
+        HotQuery("teacher_period", {"periodo": "", "cedula": ""}),
+    ]
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        """
+        Initialize the rollup with its collection.
+
+        :param db: AsyncIOMotorDatabase instance.
+        """
+        self.db = db
+        self.collection = db[ROLLUP_COLLECTION]
+
+    async def ensure_indexes(self) -> List[str]:
+        """Create the rollup indexes."""
+        return await self.collection.create_indexes(self.indexes)
+
+    async def find_collection_scans(self) -> List[str]:
+        """Explain the rollup hot queries and return the ones doing a COLLSCAN."""
+        return await find_collection_scans(self.collection, self.hot_queries)
+
+    async def add(self, documents: List[dict]) -> None:
+        """
+        Count newly created forms.
+
+        :param documents: Inserted form documents.
+        """
+        await self._apply([(document, 1) for document in documents])
+
+    async def remove(self, document: dict) -> None:
+        """
+        Discount a soft-deleted form.
+
+        :param document: The form as it was before the deletion.
+        """
+        await self._apply([(document, -1)])
+
+    async def replace(self, before: dict, after: dict) -> None:
+        """
+        Move the hours of an updated form to its new key and amount.
+
+        :param before: The form before the update.
+        :param after: The form after the update.
+        """
+        if _key(before) == _key(after) and _hours(before) == _hours(after):
+            return
+        await self._apply([(before, -1), (after, 1)])
+
+    async def _apply(self, changes: List[Tuple[dict, int]]) -> None:
+        """
+        Merge the deltas per key and send them as one bulk of upserts.
+
+        :param changes: Pairs of (form document, +1 to add it / -1 to remove it).
+        """
+        deltas: Dict[RollupKey, Dict[str, float]] = defaultdict(
+            lambda: {"totalHoras": 0.0, "registros": 0})
+        names: Dict[RollupKey, dict] = {}
+        for document, sign in changes:
+            key = _key(document)
+            if key is None:
+                continue
+            deltas[key]["totalHoras"] += sign * _hours(document)
+            deltas[key]["registros"] += sign
+            if sign > 0:
+                names[key] = {"nombre": document.get("nombre"),
+                              "apellido": document.get("apellido")}
+
+        operations = []
+        for (cedula, modulo, periodo), inc in deltas.items():
+            if not inc["totalHoras"] and not inc["registros"]:
+                continue
+            update: Dict[str, Any] = {"$inc": inc}
+            if (cedula, modulo, periodo) in names:
+                update["$set"] = names[(cedula, modulo, periodo)]
+            operations.append(UpdateOne(
+                {"periodo": periodo, "cedula": cedula, "modulo": modulo}, update, upsert=True))
+        if operations:
+            await self.collection.bulk_write(operations, ordered=False)
+
+    async def get_period(self, periodo: str, cedula: Optional[str] = None) -> List[HoursReportRow]:
+        """
+        Read the totals of a month.
+
+        :param periodo: Year-month, YYYY-MM.
+        :param cedula: Teacher identification number to scope the read to.
+        :return: One row per (cedula, modulo) with hours in that month.
+        """
+        query: Dict[str, Any] = {"periodo": periodo, "registros": {"$gt": 0}}
+        if cedula:
+            query["cedula"] = cedula
+        rows = await self.collection.find(query, {"_id": 0}).sort(
+            [("cedula", ASCENDING), ("modulo", ASCENDING)]).to_list(length=None)
+        return [HoursReportRow(**row) for row in rows]
+
+    async def rebuild(self) -> None:
+        """
+        Recompute the whole rollup from ``form_registers``.
+
+        ``$out`` swaps the collection atomically and keeps its indexes. Forms
+        written while the rebuild runs may be missed; run it in a quiet window.
+        """
+        await self.ensure_indexes()
+        pipeline = [
+            {"$match": {"is_active": True}},
+            {"$group": {
+                "_id": {
+                    "cedula": "$cedula",
+                    "modulo": "$modulo",
+                    "periodo": PERIOD_EXPRESSION,
+                },
+                "nombre": {"$last": "$nombre"},
+                "apellido": {"$last": "$apellido"},
+                "totalHoras": {"$sum": {"$convert": {
+                    "input": "$cantidadHoras", "to": "double", "onError": 0, "onNull": 0}}},
+                "registros": {"$sum": 1},
+            }},
+            # Igual que en las actualizaciones incrementales, las fechas ilegibles no cuentan
+            {"$match": {"_id.periodo": {"$ne": None}}},
+            {"$project": {
+                "_id": 0,
+                "cedula": "$_id.cedula",
+                "modulo": "$_id.modulo",
+                "periodo": "$_id.periodo",
+                "nombre": 1,
+                "apellido": 1,
+                "totalHoras": 1,
+                "registros": 1,
+            }},
+            {"$out": ROLLUP_COLLECTION},
+        ]
+        await self.db["form_registers"].aggregate(pipeline).to_list(length=None)
+        logger.info("Rebuilt %s", ROLLUP_COLLECTION)
+
+
+async def _main() -> None:
+    """Rebuild the rollup against the configured database."""
+    await MongoDB.connect()
+    try:
+        await HoursRollup(MongoDB.get_database()).rebuild()
+    finally:
+        await MongoDB.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Maintain the form hours rollup")
+    parser.add_argument("--rebuild", action="store_true", help="recompute it from scratch")
+    if not parser.parse_args().rebuild:
+        parser.print_help()
+        sys.exit(2)
+    asyncio.run(_main())
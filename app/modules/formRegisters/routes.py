@@ -1,14 +1,24 @@
 """Form Register"""
 
-from typing import List
-from fastapi import APIRouter, Depends, Path, HTTPException
+from datetime import date
+from typing import Any, List, Literal, Optional
+from fastapi import APIRouter, Body, Depends, Path, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from app.db.dependencies import get_database
-from app.modules.formRegisters.models import FormRegister, FormRegisterCreate, FormRegisterUpdate
+from app.exceptions.http_exceptions import BadRequestException
+from app.modules.formRegisters.models import (
+    FORM_REGISTER_EXPORT_FIELDS, FORM_REGISTER_EXPORT_FORMATTERS, FormRegister,
+    FormRegisterBulkResponse, FormRegisterCreate, FormRegisterUpdate, HoursReportRow)
 from app.modules.formRegisters.service import FormRegisterService
+from app.settings.settings import settings
+from app.utils.export import csv_chunks, gzip_chunks, ndjson_chunks
+from app.utils.fields import partial_response
+from app.utils.pagination import page_headers, set_page_headers
 from app.utils.security import check_admin_role, check_teacher_role
+from app.utils.timing import TimedRoute
 
-form_router = APIRouter(prefix="/forms", tags=["forms"])
+form_router = APIRouter(prefix="/forms", tags=["forms"], route_class=TimedRoute)
 
 def get_form_service(db: AsyncIOMotorDatabase = Depends(get_database)) -> FormRegisterService:
     """Dependency to provide FormService"""
@@ -21,35 +31,158 @@ async def create_form(
     user: str = Depends(check_teacher_role),
 ):
     """Create a new form"""
-    return await service.create_form(data, user.identification_number)
+    return await service.create_form_register(data, user.identification_number)
+
+@form_router.post("/bulk", response_model=FormRegisterBulkResponse)
+async def create_forms_bulk(
+    items: List[Any] = Body(..., description="Array of FormRegisterCreate items"),
+    service: FormRegisterService = Depends(get_form_service),
+    user: str = Depends(check_teacher_role),
+):
+    """Create many forms in one request, reporting the result of each item"""
+    if len(items) > settings.FORMS_BULK_MAX_ITEMS:
+        raise BadRequestException(
+            f"A bulk request accepts at most {settings.FORMS_BULK_MAX_ITEMS} items",
+            details={"items": len(items)})
+    return await service.create_form_registers_bulk(items, user.identification_number)
+
+@form_router.get("/export")
+async def export_forms(
+    export_format: Literal["csv", "ndjson"] = Query("csv", alias="format"),
+    gzip: bool = False,
+    service: FormRegisterService = Depends(get_form_service),
+    user: str = Depends(check_teacher_role),
+):
+    """Stream every form visible to the user as CSV or NDJSON"""
+    if user.role == "admin":
+        documents = service.export_cursor()
+    elif user.role == "teacher":
+        documents = service.export_cursor(user.identification_number)
+    else:
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+    if export_format == "csv":
+        chunks = csv_chunks(
+            documents, FORM_REGISTER_EXPORT_FIELDS, FORM_REGISTER_EXPORT_FORMATTERS)
+        media_type = "text/csv"
+    else:
+        chunks = ndjson_chunks(
+            documents, FORM_REGISTER_EXPORT_FIELDS, FORM_REGISTER_EXPORT_FORMATTERS)
+        media_type = "application/x-ndjson"
+
+    filename = f"forms.{export_format}"
+    if gzip:
+        chunks, media_type, filename = gzip_chunks(chunks), "application/gzip", filename + ".gz"
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+@form_router.get("/reports/hours", response_model=List[HoursReportRow])
+async def hours_report(
+    from_date: Optional[date] = Query(None, alias="from"),
+    to_date: Optional[date] = Query(None, alias="to"),
+    by_month: bool = False,
+    service: FormRegisterService = Depends(get_form_service),
+    user: str = Depends(check_teacher_role),
+):
+    """Total hours per teacher and module in a date range"""
+    if user.role == "admin":
+        return await service.get_hours_report(from_date, to_date, by_month=by_month)
+    elif user.role == "teacher":
+        return await service.get_hours_report(
+            from_date, to_date, user.identification_number, by_month)
+    else:
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+@form_router.get("/reports/hours/monthly", response_model=List[HoursReportRow])
+async def monthly_hours(
+    periodo: str = Query(..., pattern=r"^\d{4}-\d{2}$", description="Year-month, YYYY-MM"),
+    service: FormRegisterService = Depends(get_form_service),
+    user: str = Depends(check_teacher_role),
+):
+    """Monthly hours per teacher and module, read from the maintained rollup"""
+    if user.role == "admin":
+        return await service.get_monthly_hours(periodo)
+    elif user.role == "teacher":
+        return await service.get_monthly_hours(periodo, user.identification_number)
+    else:
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+@form_router.get("/search", response_model=List[FormRegister])
+async def search_forms(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description="Words to search"),
+    limit: int = Query(100, ge=1, le=settings.LIST_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    service: FormRegisterService = Depends(get_form_service),
+    user: str = Depends(check_teacher_role),
+):
+    """Search forms by teacher name and content, most relevant first"""
+    selected = service.parse_fields(fields)
+    if user.role == "admin":
+        cedula = None  # Admin busca en todos los formularios
+    elif user.role == "teacher":
+        cedula = user.identification_number
+    else:
+        raise HTTPException(status_code=403, detail="Forbidden")
+    items, next_cursor = await service.search_forms(q, limit, cursor, cedula, selected)
+    if selected:
+        return partial_response(items, selected, page_headers(next_cursor))
+    set_page_headers(response, next_cursor)
+    return items
 
 @form_router.get("/{form_id}", response_model=FormRegister)
 async def get_form(
     form_id: str = Path(..., title="The ID of the form to get"),
+    fields: Optional[str] = None,
     service: FormRegisterService = Depends(get_form_service),
     user: str = Depends(check_teacher_role),
 ):
     """Get a specific form by ID"""
-    form = await service.get_by_id_or_raise(form_id)
+    selected = service.parse_fields(fields)
+    # cedula se lee siempre para validar la propiedad del formulario
+    form = await service.get_by_id_or_raise(
+        form_id, "FormRegister", selected and [*selected, "cedula"])
     # Verificar si el teacher solo puede ver su formulario
     if user.role == "teacher" and form.cedula != user.identification_number:
         raise HTTPException(status_code=403, detail="Forbidden")
+    if selected:
+        return partial_response(form, selected)
     return form
 
 @form_router.get("/", response_model=List[FormRegister])
 async def list_forms(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=settings.LIST_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    from_date: Optional[date] = Query(None, alias="from"),
+    to_date: Optional[date] = Query(None, alias="to"),
+    fields: Optional[str] = None,
+    estimate: bool = False,
     service: FormRegisterService = Depends(get_form_service),
     user: str = Depends(check_teacher_role),  # Tanto admin como teacher pueden listar
 ):
-    """List forms based on user role"""
+    """List forms based on user role, in chronological order"""
+    selected = service.parse_fields(fields)
     if user.role == "admin":
-        return await service.get_all(skip, limit)  # Admin puede ver todos
+        cedula = None  # Admin puede ver todos
     elif user.role == "teacher":
-        return await service.get_teacher_forms(user.identification_number, skip, limit)
+        cedula = user.identification_number
     else:
         raise HTTPException(status_code=403, detail="Forbidden")
+    items, next_cursor = await service.get_forms_page(
+        skip, limit, cursor, cedula, from_date, to_date, selected)
+    # El estimado solo aplica al listado sin filtros y cuenta también los desactivados
+    estimated = estimate and cedula is None and from_date is None and to_date is None
+    total = await service.count_forms(cedula, from_date, to_date, estimated)
+    if selected:
+        return partial_response(items, selected, page_headers(next_cursor, total, estimated))
+    set_page_headers(response, next_cursor, total, estimated)
+    return items
 
 @form_router.put("/{form_id}", response_model=FormRegister)
 async def update_form(
@@ -59,11 +192,14 @@ async def update_form(
     user: str = Depends(check_teacher_role),  # Tanto admin como teacher pueden actualizar
 ):
     """Update a specific form"""
-    form = await service.get_by_id_or_raise(form_id)
-    # Verificar si el teacher solo puede actualizar su formulario
-    if user.role == "teacher" and form.cedula != user.identification_number:
+    # El teacher solo puede actualizar su formulario: se filtra por cedula en la misma escritura
+    cedula = user.identification_number if user.role == "teacher" else None
+    form = await service.update_form_register(form_id, data, user.identification_number, cedula)
+    if not form:
+        # Solo en el camino de error: distinguir entre inexistente (404) y ajeno (403)
+        await service.get_by_id_or_raise(form_id, "FormRegister")
         raise HTTPException(status_code=403, detail="Forbidden")
-    return await service.update_form(form_id, data, user.identification_number)
+    return form
 
 @form_router.delete("/{form_id}")
 async def delete_form(
@@ -72,7 +208,7 @@ async def delete_form(
     user: str = Depends(check_admin_role),  # Solo admin puede eliminar
 ):
     """Soft delete a form"""
-    success = await service.delete_form(form_id, user)
+    success = await service.delete_form_register(form_id, user.identification_number)
     if not success:
         raise HTTPException(status_code=404, detail="Form not found")
     return {"message": "Form is disabled"}
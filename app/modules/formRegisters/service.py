@@ -2,46 +2,295 @@
 Service CRUD Class Register
 """
 
-from typing import List, Optional
-from motor.motor_asyncio import AsyncIOMotorDatabase
-from app.modules.formRegisters.models import FormRegister, FormRegisterCreate, FormRegisterUpdate
-from app.utils.crud_base import CRUDBase
+from datetime import date, datetime, time, timedelta
+from typing import Any, List, Optional, Tuple
+from motor.motor_asyncio import AsyncIOMotorCursor, AsyncIOMotorDatabase
+from pydantic import ValidationError
+from app.modules.formRegisters.models import (
+    FormRegister, FormRegisterBulkItemResult, FormRegisterBulkResponse,
+    FormRegisterCreate, FormRegisterUpdate, HoursReportRow)
+from pymongo import ASCENDING, TEXT, IndexModel
+from app.exceptions.http_exceptions import BadRequestException
+from app.modules.formRegisters.rollup import PERIOD_EXPRESSION, HoursRollup
+from app.settings.settings import settings
+from app.utils.crud_base import ACTIVE_ONLY, CRUDBase, HotQuery
+from app.utils.pagination import decode_cursor
+
+
+def fecha_range(from_date: Optional[date], to_date: Optional[date]) -> dict:
+    """
+    Build the filter on ``fecha`` for an inclusive range of days.
+
+    :param from_date: First day included.
+    :param to_date: Last day included.
+    :return: Filter fragment, empty when no bound is given.
+    """
+    bounds = {}
+    if from_date:
+        bounds["$gte"] = datetime.combine(from_date, time.min)
+    if to_date:
+        bounds["$lt"] = datetime.combine(to_date + timedelta(days=1), time.min)
+    return {"fecha": bounds} if bounds else {}
+
+
+def forms_query(
+    cedula: Optional[str] = None, from_date: Optional[date] = None, to_date: Optional[date] = None
+) -> dict:
+    """
+    Build the filter of a form listing.
+
+    :param cedula: Teacher identification number, when scoped to one teacher.
+    :param from_date: First day included.
+    :param to_date: Last day included.
+    :return: MongoDB filter (without ``is_active``).
+    """
+    query = fecha_range(from_date, to_date)
+    if cedula:
+        query["cedula"] = cedula
+    return query
 
 
 class FormRegisterService(CRUDBase[FormRegister]):
     """Service layer for handling FormRegister-related operations."""
 
+    # Los listados se ordenan cronológicamente (fecha, _id)
+    sort_field = "fecha"
+
+    indexes = CRUDBase.indexes + [
+        IndexModel([("cedula", ASCENDING), ("fecha", ASCENDING), ("_id", ASCENDING)],
+                   name="cedula_fecha_id_active", partialFilterExpression=ACTIVE_ONLY),
+        IndexModel([("fecha", ASCENDING), ("_id", ASCENDING)], name="fecha_id_active",
+                   partialFilterExpression=ACTIVE_ONLY),
+        # Búsqueda de texto: el nombre del docente pesa más que el contenido de la clase
+        IndexModel([("nombre", TEXT), ("apellido", TEXT), ("contenido", TEXT)],
+                   name="nombre_apellido_contenido_text", default_language="spanish",
+                   weights={"nombre": 3, "apellido": 3, "contenido": 1}),
+    ]
+    hot_queries = CRUDBase.hot_queries + [
+        HotQuery("list_by_fecha", {"is_active": True},
+                 [("fecha", ASCENDING), ("_id", ASCENDING)]),
+        HotQuery("teacher_forms_page", {"is_active": True, "cedula": ""},
+                 [("fecha", ASCENDING), ("_id", ASCENDING)]),
+        HotQuery("teacher_forms_range",
+                 {"is_active": True, "cedula": "", "fecha": {"$gte": datetime(2000, 1, 1)}},
+                 [("fecha", ASCENDING), ("_id", ASCENDING)]),
+        HotQuery("search", {"is_active": True, "$text": {"$search": "clase"}}),
+    ]
+    # Versión sin filtro parcial, que solo usaba el antiguo get_teacher_forms
+    dropped_indexes = ["cedula_fecha_id"]
+
     def __init__(self, db: AsyncIOMotorDatabase):
         """Initialize FormRegisterService with database connection."""
         super().__init__(db, "form_registers", FormRegister)
+        self.rollup = HoursRollup(db)
 
     async def create_form_register(self, data: FormRegisterCreate, created_by: str) -> FormRegister:
         """Create a new FormRegister entry."""
         return await self.create(data.model_dump(), created_by)
 
+    async def create_form_registers_bulk(
+        self, items: List[Any], created_by: str
+    ) -> FormRegisterBulkResponse:
+        """
+        Validate a batch of FormRegisterCreate payloads and insert the valid ones.
+
+        :param items: Raw items as received in the request body.
+        :param created_by: User who submits the batch.
+        :return: Totals and the per-item outcome, in input order.
+        """
+        results: List[Optional[FormRegisterBulkItemResult]] = [None] * len(items)
+        valid_indexes, documents = [], []
+        for index, item in enumerate(items):
+            try:
+                documents.append(FormRegisterCreate.model_validate(item).model_dump())
+                valid_indexes.append(index)
+            except ValidationError as exc:
+                results[index] = FormRegisterBulkItemResult(
+                    index=index, status="error",
+                    errors=exc.errors(
+                        include_url=False, include_context=False, include_input=False))
+
+        outcomes = await self.create_many(documents, created_by, settings.FORMS_BULK_CHUNK_SIZE)
+        for index, outcome in zip(valid_indexes, outcomes):
+            if isinstance(outcome, str):
+                results[index] = FormRegisterBulkItemResult(index=index, status="created", id=outcome)
+            else:
+                results[index] = FormRegisterBulkItemResult(
+                    index=index, status="error", errors=[outcome])
+
+        inserted = sum(1 for result in results if result.status == "created")
+        return FormRegisterBulkResponse(
+            inserted=inserted, failed=len(items) - inserted, results=results)
+
+    def export_cursor(self, cedula: Optional[str] = None) -> AsyncIOMotorCursor:
+        """
+        Return a raw cursor over the active forms, optionally for a single teacher.
+        Documents are fetched lazily in batches of FORMS_EXPORT_BATCH_SIZE.
+
+        :param cedula: Teacher identification number to scope the export to.
+        :return: Motor cursor ordered by _id.
+        """
+        query = {"is_active": True}
+        if cedula:
+            query["cedula"] = cedula
+        return (self.collection.find(query)
+                .sort("_id", ASCENDING)
+                .batch_size(settings.FORMS_EXPORT_BATCH_SIZE))
+
+    async def get_hours_report(
+        self,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+        cedula: Optional[str] = None,
+        by_month: bool = False,
+    ) -> List[HoursReportRow]:
+        """
+        Sum cantidadHoras per teacher and module with a single aggregation.
+
+        :param from_date: First day included (inclusive).
+        :param to_date: Last day included (inclusive).
+        :param cedula: Teacher identification number to scope the report to.
+        :param by_month: Also group by the year-month of ``fecha``.
+        :return: One row per (cedula, modulo[, month]).
+        """
+        match: dict = {"is_active": True, **fecha_range(from_date, to_date)}
+        if cedula:
+            match["cedula"] = cedula
+
+        group_id = {"cedula": "$cedula", "modulo": "$modulo"}
+        if by_month:
+            group_id["periodo"] = PERIOD_EXPRESSION
+
+        pipeline = [
+            {"$match": match},
+            {"$group": {
+                "_id": group_id,
+                "nombre": {"$first": "$nombre"},
+                "apellido": {"$first": "$apellido"},
+                "totalHoras": {"$sum": {"$convert": {
+                    "input": "$cantidadHoras", "to": "double", "onError": 0, "onNull": 0}}},
+                "registros": {"$sum": 1},
+            }},
+            {"$sort": {"_id.cedula": 1, "_id.modulo": 1, "_id.periodo": 1}},
+        ]
+        rows = await self.collection.aggregate(pipeline).to_list(length=None)
+        return [HoursReportRow(**row.pop("_id"), **row) for row in rows]
+
+    async def get_monthly_hours(
+        self, periodo: str, cedula: Optional[str] = None
+    ) -> List[HoursReportRow]:
+        """
+        Read the monthly totals from the incrementally maintained rollup.
+
+        :param periodo: Year-month, YYYY-MM.
+        :param cedula: Teacher identification number to scope the read to.
+        :return: One row per (cedula, modulo).
+        """
+        return await self.rollup.get_period(periodo, cedula)
+
+    async def _on_created_many(self, documents: List[dict]) -> None:
+        """Add the new forms to the hours rollup."""
+        await self.rollup.add(documents)
+
+    async def _on_created(self, document: dict) -> None:
+        """Add the new form to the hours rollup."""
+        await self.rollup.add([document])
+
+    async def _on_updated(self, before: dict, after: dict) -> None:
+        """Apply the old-versus-new hours difference to the rollup."""
+        await self.rollup.replace(before, after)
+
+    async def _on_deleted(self, document: dict) -> None:
+        """Discount the deleted form from the rollup."""
+        await self.rollup.remove(document)
+
     async def get_all_form_registers(self, skip: int = 0, limit: int = 100) -> List[FormRegister]:
         """Retrieve all form registers with pagination."""
-        return [
-            FormRegister(**form_register) for form_register in await super().get_all(skip, limit)]
+        return await super().get_all(skip, limit)
 
-    async def update_form_register(self, form_register_id: str, data: FormRegisterUpdate, updated_by: str) -> FormRegister:
-        """Update form register details."""
-        return await self.update(form_register_id, data.model_dump(exclude_unset=True), updated_by)
+    async def update_form_register(
+        self,
+        form_register_id: str,
+        data: FormRegisterUpdate,
+        updated_by: str,
+        cedula: Optional[str] = None,
+    ) -> Optional[FormRegister]:
+        """Update form register details, optionally only if it belongs to the given teacher."""
+        query = {"cedula": cedula} if cedula else None
+        return await self.update(
+            form_register_id, data.model_dump(exclude_unset=True), updated_by, query)
 
     async def delete_form_register(self, form_register_id: str, deleted_by: str) -> bool:
         """Disable a form register instead of deleting it permanently."""
-        await self.get_by_id_or_raise(form_register_id, "FormRegister")
         return await super().delete(form_register_id, deleted_by)
 
-    async def get_teacher_forms(self, teacher_identification_number: str, skip: int = 0, limit: int = 100) -> List[FormRegister]:
-        """Retrieve all forms for a specific teacher."""
+    async def get_forms_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        cedula: Optional[str] = None,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[FormRegister], Optional[str]]:
+        """Retrieve a chronological page of active forms, optionally for one teacher and date range."""
+        return await self.get_page(
+            skip, limit, cursor, forms_query(cedula, from_date, to_date), fields)
+
+    async def count_forms(
+        self,
+        cedula: Optional[str] = None,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+        estimated: bool = False,
+    ) -> int:
+        """Count the active forms listed by get_forms_page with the same filters."""
+        query = forms_query(cedula, from_date, to_date)
+        return await self.count(query, estimated=estimated)
+
+    async def search_forms(
+        self,
+        text: str,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        cedula: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[FormRegister], Optional[str]]:
+        """
+        Full-text search of active forms by teacher name and class content, most relevant first.
+
+        Results are ordered by text score and then ``_id``; the cursor carries both,
+        so the next page continues right after the last result.
 
-        query = {"cedula": teacher_identification_number}
-        forms = await self.collection.find(query).skip(skip).limit(limit).to_list(length=limit)
+        :param text: Words to search (MongoDB ``$text`` syntax: "phrases" and -exclusions).
+        :param limit: Maximum number of forms to return.
+        :param cursor: Opaque cursor returned with the previous page.
+        :param cedula: Teacher identification number, when scoped to one teacher.
+        :param fields: Only return these fields (see ``parse_fields``).
+        :return: Tuple with the forms and the cursor of the next page.
+        """
+        if limit < 1:
+            return [], None
 
-        return [FormRegister(**self._convert_document(form)) for form in forms]
+        match = {"$text": {"$search": text}, "is_active": True}
+        if cedula:
+            match["cedula"] = cedula
+        pipeline = [{"$match": match}, {"$addFields": {"_score": {"$meta": "textScore"}}}]
+        if cursor:
+            last_id, last_score = decode_cursor(cursor)
+            if not isinstance(last_score, (int, float)):
+                raise BadRequestException(
+                    "Invalid pagination cursor", "INVALID_CURSOR", {"cursor": cursor})
+            pipeline.append({"$match": {"$or": [
+                {"_score": {"$lt": last_score}},
+                {"_score": last_score, "_id": {"$gt": last_id}},
+            ]}})
+        pipeline += [{"$sort": {"_score": -1, "_id": 1}}, {"$limit": limit + 1}]
+        projection = self._projection(fields)
+        if projection:
+            pipeline.append({"$project": {**projection, "_score": 1}})
+        documents = await self.collection.aggregate(pipeline).to_list(length=limit + 1)
 
-    def _convert_document(self, doc):
-        """Convert MongoDB document to Python dictionary and handle ObjectId"""
-        doc["_id"] = str(doc["_id"]) if "_id" in doc else None
-        return doc
\ No newline at end of file
+        documents, next_cursor = self._trim_page(documents, limit, "_score")
+        return [self._convert_document(doc, fields) for doc in documents], next_cursor
@@ -0,0 +1,18 @@
+"""Metrics routes"""
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+from app.utils.metrics import render_prometheus
+from app.utils.security import check_admin_role
+from app.utils.timing import TimedRoute
+
+metrics_router = APIRouter(tags=["metrics"], route_class=TimedRoute)
+
+# Versión del formato de texto de Prometheus
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@metrics_router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics(user: str = Depends(check_admin_role)):
+    """Expose the in-process metrics in Prometheus text format (admins only)"""
+    return PlainTextResponse(render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
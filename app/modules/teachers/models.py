@@ -31,6 +31,13 @@ class TeacherUpdate(TeacherBase):
     is_active: bool
     role: str
 
+class TeacherSuggestion(BaseModel):
+    """Autocomplete entry for a teacher"""
+    id: str
+    name: str
+    lastname: str
+    identification_number: str
+
 class TeacherResponse(TeacherBase):
     """Response model for Teacher with string _id"""
     id: str = Field(alias="_id")
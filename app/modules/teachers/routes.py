@@ -1,15 +1,20 @@
 """Teacher routes"""
 
-from typing import List
-from fastapi import APIRouter, Depends, Path
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Path, Query, Response
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from app.db.dependencies import get_database
 from app.exceptions.http_exceptions import NotFoundException
+from app.models.base_model import BatchRequest, BatchResponse
 from app.modules.teachers.services import TeacherService
-from app.modules.teachers.models import Teacher, TeacherCreate, TeacherUpdate
+from app.modules.teachers.models import Teacher, TeacherCreate, TeacherSuggestion, TeacherUpdate
+from app.settings.settings import settings
+from app.utils.fields import partial_response
+from app.utils.pagination import page_headers, set_page_headers
 from app.utils.security import check_admin_role
+from app.utils.timing import TimedRoute
 
-teacher_router = APIRouter(prefix="/teachers", tags=["teachers"])
+teacher_router = APIRouter(prefix="/teachers", tags=["teachers"], route_class=TimedRoute)
 
 def get_teacher_service(db: AsyncIOMotorDatabase = Depends(get_database)) -> TeacherService:
     """Dependency to provide TeacherService"""
@@ -24,24 +29,60 @@ async def create_teacher(
     """Create a new teacher"""
     return await service.create_teacher(data, user.identification_number)
 
+@teacher_router.get("/suggest", response_model=List[TeacherSuggestion])
+async def suggest_teachers(
+    prefix: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=settings.SUGGEST_MAX_LIMIT),
+    service: TeacherService = Depends(get_teacher_service),
+    user: str = Depends(check_admin_role),
+):
+    """Teachers whose name, lastname or identification number starts with the prefix"""
+    return await service.suggest(prefix, limit)
+
 @teacher_router.get("/{teacher_id}", response_model=Teacher)
 async def get_teacher(
     teacher_id: str = Path(..., title="The ID of the teacher to get"),
+    fields: Optional[str] = None,
     service: TeacherService = Depends(get_teacher_service),
     user: str = Depends(check_admin_role),
 ):
     """Get a specific teacher by ID"""
-    return await service.get_by_id_or_raise(teacher_id, "Teacher")
+    selected = service.parse_fields(fields)
+    teacher = await service.get_by_id_or_raise(teacher_id, "Teacher", selected)
+    if selected:
+        return partial_response(teacher, selected)
+    return teacher
 
 @teacher_router.get("/", response_model=List[Teacher])
 async def list_teachers(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=settings.LIST_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    estimate: bool = False,
     service: TeacherService = Depends(get_teacher_service),
     user: str = Depends(check_admin_role),
 ):
     """List all teachers with pagination"""
-    return await service.get_all(skip, limit)
+    selected = service.parse_fields(fields)
+    items, next_cursor = await service.get_page(skip, limit, cursor, fields=selected)
+    # El estimado cuenta también los documentos desactivados: solo si el cliente lo pide
+    total = await service.count(estimated=estimate)
+    if selected:
+        return partial_response(items, selected, page_headers(next_cursor, total, estimate))
+    set_page_headers(response, next_cursor, total, estimate)
+    return items
+
+@teacher_router.post("/batch", response_model=BatchResponse[Teacher])
+async def get_teachers_batch(
+    data: BatchRequest,
+    service: TeacherService = Depends(get_teacher_service),
+    user: str = Depends(check_admin_role),
+):
+    """Get several teachers by ID in one request"""
+    items, missing = await service.get_many(data.ids)
+    return BatchResponse[Teacher](items=items, missing=missing)
 
 @teacher_router.put("/{teacher_id}", response_model=Teacher)
 async def update_teacher(
@@ -60,7 +101,7 @@ async def delete_teacher(
     user: str = Depends(check_admin_role),
 ):
     """Soft delete a teacher"""
-    success = await service.delete_teacher(teacher_id, user)
+    success = await service.delete_teacher(teacher_id, user.identification_number)
     if not success:
         raise NotFoundException("Teacher", teacher_id)
     return {"message": "Teacher is disabled"}
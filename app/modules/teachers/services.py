@@ -1,16 +1,36 @@
 """ Service CRUD Teachers """
 
-from typing import List
+from typing import List, Tuple
 from bson import ObjectId
 from fastapi import HTTPException
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from app.exceptions.http_exceptions import DuplicateResourceException
-from app.modules.teachers.models import Teacher, TeacherCreate, TeacherUpdate
-from app.utils.crud_base import CRUDBase
-
-class TeacherService(CRUDBase[Teacher]):
+from pymongo import ASCENDING, IndexModel
+from app.exceptions.http_exceptions import DuplicateResourceException, NotFoundException
+from app.modules.teachers.models import Teacher, TeacherCreate, TeacherSuggestion, TeacherUpdate
+from app.utils.crud_base import ACTIVE_ONLY, CRUDBase, HotQuery, entity_cache
+from app.utils.prefix_index import PrefixIndex, word_suffixes
+from app.utils.suggestions import SuggestionsMixin
+
+class TeacherService(SuggestionsMixin, CRUDBase[Teacher]):
     """Service layer for handling Teacher-related operations."""
 
+    indexes = CRUDBase.indexes + [
+        IndexModel([("email", ASCENDING)], name="email_active",
+                   partialFilterExpression=ACTIVE_ONLY),
+        IndexModel([("identification_number", ASCENDING)], name="identification_number_active",
+                   partialFilterExpression=ACTIVE_ONLY),
+    ]
+    hot_queries = CRUDBase.hot_queries + [
+        HotQuery("duplicate_email", {"email": "", "is_active": True}),
+        HotQuery("duplicate_identification_number",
+                 {"identification_number": "", "is_active": True}),
+    ]
+    cache = entity_cache("teachers")
+
+    # Autocompletado por nombre, apellido o número de identificación
+    suggestions = PrefixIndex()
+    suggestion_fields = ("name", "lastname", "identification_number")
+
     def __init__(self, db: AsyncIOMotorDatabase):
         """Initialize TeacherService with database connection."""
         super().__init__(db, "teachers", Teacher)
@@ -23,38 +43,47 @@ class TeacherService(CRUDBase[Teacher]):
 
     async def get_all_teachers(self, skip: int = 0, limit: int = 100) -> List[Teacher]:
         """Retrieve all teachers with pagination."""
-        return [Teacher(**teacher) for teacher in await super().get_all(skip, limit)]
+        return await super().get_all(skip, limit)
 
     async def update_teacher(self, teacher_id: str, data: TeacherUpdate, updated_by: str) -> Teacher:
-        """Update teacher details after checking for duplicate email and identification number."""
+        """
+        Update teacher details after checking for duplicate email and identification number.
+
+        An email or identification number in the request is always checked against the
+        other active teachers, even when it is unchanged. The updated teacher is returned
+        even when the update disables it (``is_active: False``).
+        """
 
         try:
             obj_id = ObjectId(teacher_id)
         except Exception as exc:
             raise HTTPException(status_code=400, detail="Invalid teacher ID format") from exc
 
-        teacher = await self.get_by_id_or_raise(teacher_id, "Teacher")
-
-        if not teacher:
-            raise HTTPException(status_code=404, detail="Teacher not found")
+        if data.email:
+            await self._check_duplicate_email(data.email, exclude_id=obj_id)
 
-        if data.email and data.email != teacher.email:
-            await self._check_duplicate_email(data.email, exclude_id=teacher.id)
+        if data.identification_number:
+            await self._check_duplicate_identification_number(
+                data.identification_number, exclude_id=obj_id)
 
-        if data.identification_number and data.identification_number != teacher.identification_number:
-            await self._check_duplicate_identification_number(data.identification_number, exclude_id=teacher.id)
-
-        await self.update(obj_id, data.model_dump(exclude_unset=True), updated_by)
-
-        return await self.get_by_id_or_raise(teacher_id, "Teacher")
+        teacher = await self.update(teacher_id, data.model_dump(exclude_unset=True), updated_by)
+        if not teacher:
+            raise NotFoundException("Teacher", teacher_id)
+        return teacher
 
 
     async def delete_teacher(self, teacher_id: str, deleted_by: str) -> bool:
         """Disable a teacher instead of deleting them permanently."""
-        await self.get_by_id_or_raise(teacher_id, "Teacher")
         return await super().delete(teacher_id, deleted_by)
 
-    async def _check_duplicate_email(self, email: str, exclude_id: str = None) -> None:
+    def _suggestion(self, document: dict) -> Tuple[TeacherSuggestion, List[str]]:
+        """Index a teacher by any word of the full name and by identification number."""
+        suggestion = TeacherSuggestion(id=str(document["_id"]), **{
+            field: document[field] for field in self.suggestion_fields})
+        full_name = f"{suggestion.name} {suggestion.lastname}"
+        return suggestion, [*word_suffixes(full_name), suggestion.identification_number]
+
+    async def _check_duplicate_email(self, email: str, exclude_id: ObjectId = None) -> None:
         """Check if a teacher with the given email already exists."""
         query = {"email": email, "is_active": True}
         if exclude_id:
@@ -63,7 +92,7 @@ class TeacherService(CRUDBase[Teacher]):
             raise DuplicateResourceException("Teacher", "email", email)
 
     async def _check_duplicate_identification_number(
-            self, identification_number: str, exclude_id: str = None) -> None:
+            self, identification_number: str, exclude_id: ObjectId = None) -> None:
         """Check if a teacher with the given identification number already exists."""
         query = {"identification_number": identification_number, "is_active": True}
         if exclude_id:
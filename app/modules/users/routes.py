@@ -5,13 +5,27 @@ from fastapi import APIRouter, Depends
 from fastapi.security import OAuth2PasswordBearer
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from app.db.dependencies import get_database
+from app.db.pool_metrics import pool_metrics
 from app.modules.users.models import LoginRequest, UserCreate
-from app.modules.users.service import UserService
-from app.utils.security import create_access_token, decode_access_token
+from app.modules.users.service import UserService, user_cache
+from app.settings.settings import settings
+from app.utils.admission import AdmissionLimiter
+from app.utils.crud_base import count_cache, entity_caches
+from app.utils.security import (
+    check_admin_role, create_access_token, decode_access_token, hash_latency, token_cache)
+from app.utils.timing import TimedRoute
 
-router = APIRouter(prefix="/auth", tags=["Authentication"])
+router = APIRouter(prefix="/auth", tags=["Authentication"], route_class=TimedRoute)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
+# Limita los hashes bcrypt concurrentes de /auth/login y /auth/register
+auth_limiter = AdmissionLimiter(
+    "Authentication",
+    settings.AUTH_MAX_CONCURRENCY,
+    settings.AUTH_MAX_QUEUE,
+    settings.AUTH_QUEUE_TIMEOUT_SECONDS,
+)
+
 def get_user_service(db: AsyncIOMotorDatabase = Depends(get_database)) -> UserService:
     """Dependency to provide ClassroomService"""
     return UserService(db)
@@ -28,7 +42,8 @@ async def register_user(
     :param user_service: Dependencia de UserService para acceder a la lógica de creación.
     :return: Mensaje de éxito con los detalles del nuevo usuario.
     """
-    user = await user_service.create_user(user_data)
+    async with auth_limiter.slot():
+        user = await user_service.create_user(user_data)
     return {"message": "User created successfully", "user": user}
 
 @router.post("/login")
@@ -45,7 +60,8 @@ async def login(
     """
     identification_number = request.identification_number
     password = request.password
-    user = await user_service.authenticate_user(identification_number, password)
+    async with auth_limiter.slot():
+        user = await user_service.authenticate_user(identification_number, password)
 
     token_data = {
         "sub": str(user["_id"]),
@@ -72,3 +88,20 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db=Depends()):
     payload = decode_access_token(token)
     user = await UserService(db).get_by_id(payload["sub"])
     return user
+
+@router.get("/stats")
+async def get_auth_stats(user: str = Depends(check_admin_role)):
+    """
+    Expose authentication runtime counters (admins only).
+
+    :return: Admission queue, password hashing latency and cache stats.
+    """
+    return {
+        "admission": auth_limiter.stats(),
+        "password_hashing": hash_latency.stats(),
+        "user_cache": user_cache.stats(),
+        "token_cache": token_cache.stats(),
+        "count_cache": count_cache.stats(),
+        "entity_caches": {name: cache.stats() for name, cache in entity_caches.items()},
+        "mongo_pool": pool_metrics.stats(),
+    }
@@ -2,10 +2,16 @@
 
 from typing import Optional
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from app.utils.crud_base import CRUDBase
+from pymongo import ASCENDING, IndexModel
+from app.utils.crud_base import CRUDBase, HotQuery
 from app.modules.users.models import UserCreate, UserBase
 from app.exceptions.http_exceptions import UnauthorizedException
-from app.utils.security import hash_password, verify_password
+from app.settings.settings import settings
+from app.utils.cache import TTLCache
+from app.utils.security import hash_password_async, verify_password_async
+
+# Usuarios activos resueltos por el middleware de autenticación, por id
+user_cache = TTLCache(settings.USER_CACHE_MAXSIZE, settings.USER_CACHE_TTL_SECONDS)
 
 class UserService(CRUDBase[UserBase]):
     """
@@ -13,6 +19,13 @@ class UserService(CRUDBase[UserBase]):
     Inherits from CRUDBase for basic database operations.
     """
 
+    indexes = CRUDBase.indexes + [
+        IndexModel([("identification_number", ASCENDING)], name="identification_number"),
+    ]
+    hot_queries = CRUDBase.hot_queries + [
+        HotQuery("authenticate", {"identification_number": ""}),
+    ]
+
     def __init__(self, db: AsyncIOMotorDatabase):
         """
         Initialize the UserService with the 'users' collection.
@@ -29,9 +42,55 @@ class UserService(CRUDBase[UserBase]):
         :return: Created user document.
         """
         user_data_dict = user_data.model_dump()
-        user_data_dict["password"] = hash_password(user_data.password)  # Encrypt password
+        user_data_dict["password"] = await hash_password_async(user_data.password)  # Encrypt password
         return await self.create(user_data_dict, created_by="system")
 
+    async def get_active_user(self, user_id: str) -> Optional[UserBase]:
+        """
+        Retrieve an active user by ID, served from the in-process cache when possible.
+
+        :param user_id: User ID (the token ``sub``).
+        :return: The user or None if not found or inactive.
+        """
+        user = user_cache.get(user_id)
+        if user is None:
+            generation = user_cache.generation(user_id)
+            user = await self.get_by_id(user_id)
+            if user is not None and user.is_active:
+                # No se guarda si una escritura invalidó al usuario durante la lectura
+                user_cache.set(user_id, user, generation=generation)
+        return user
+
+    async def update(
+        self, document_id: str, data: dict, updated_by: str, query: Optional[dict] = None
+    ) -> Optional[UserBase]:
+        """
+        Update a user and drop it from the authentication cache.
+
+        :param document_id: The user ID.
+        :param data: Dictionary with updated fields.
+        :param updated_by: User who is updating the document.
+        :param query: Extra filter the document must match.
+        :return: The updated user or None if not found.
+        """
+        try:
+            return await super().update(document_id, data, updated_by, query)
+        finally:
+            user_cache.invalidate(str(document_id))
+
+    async def delete(self, document_id: str, deleted_by: str) -> bool:
+        """
+        Deactivate a user and drop it from the authentication cache.
+
+        :param document_id: The user ID.
+        :param deleted_by: User performing the deletion.
+        :return: True if deletion was successful, False otherwise.
+        """
+        try:
+            return await super().delete(document_id, deleted_by)
+        finally:
+            user_cache.invalidate(str(document_id))
+
     async def authenticate_user(self, identification_number: str, password: str) -> Optional[dict]:
         """
         Authenticates a user by verifying their password.
@@ -42,6 +101,6 @@ class UserService(CRUDBase[UserBase]):
         :raises UnauthorizedException: If authentication fails.
         """
         user = await self.collection.find_one({"identification_number": identification_number})
-        if not user or not verify_password(password, user["password"]):
+        if not user or not await verify_password_async(password, user["password"]):
             raise UnauthorizedException("Invalid credentials")
         return user
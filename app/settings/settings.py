@@ -7,12 +7,65 @@ class Settings(BaseSettings):
 
     MONGO_URI: str = Field(default="mongodb://localhost:27017", validation_alias="MONGO_URI")
     MONGO_DB: str = Field(default="mi_base_de_datos", validation_alias="MONGO_DB")
+    # Ejecuta explain() sobre las consultas críticas al iniciar y falla si hay COLLSCAN
+    MONGO_VERIFY_INDEXES: bool = Field(default=False, validation_alias="MONGO_VERIFY_INDEXES")
+
+    # Pool de conexiones por proceso (worker); None deja el valor por defecto del driver
+    MONGO_MAX_POOL_SIZE: int = Field(default=100, validation_alias="MONGO_MAX_POOL_SIZE")
+    MONGO_MIN_POOL_SIZE: int = Field(default=0, validation_alias="MONGO_MIN_POOL_SIZE")
+    MONGO_MAX_IDLE_TIME_MS: int | None = Field(default=None, validation_alias="MONGO_MAX_IDLE_TIME_MS")
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: int | None = Field(
+        default=None, validation_alias="MONGO_WAIT_QUEUE_TIMEOUT_MS")
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = Field(
+        default=5000, validation_alias="MONGO_SERVER_SELECTION_TIMEOUT_MS")
+    # Lista separada por comas, p. ej. "zstd,snappy,zlib" (zstd y snappy requieren paquetes extra)
+    MONGO_COMPRESSORS: str | None = Field(default=None, validation_alias="MONGO_COMPRESSORS")
 
     # Nuevas variables que causaban el error
     SECRET_KEY: str = Field(..., env="SECRET_KEY")
     ALGORITHM: str = Field(..., env="ALGORITHM")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(..., env="ACCESS_TOKEN_EXPIRE_MINUTES")
 
+    # Caché en memoria de usuarios autenticados (JWTAuthMiddleware)
+    USER_CACHE_TTL_SECONDS: float = Field(default=60, validation_alias="USER_CACHE_TTL_SECONDS")
+    USER_CACHE_MAXSIZE: int = Field(default=1024, validation_alias="USER_CACHE_MAXSIZE")
+
+    # Caché de tokens JWT ya verificados (acotada por número de entradas)
+    TOKEN_CACHE_MAXSIZE: int = Field(default=4096, validation_alias="TOKEN_CACHE_MAXSIZE")
+    TOKEN_CACHE_TTL_SECONDS: float = Field(default=300, validation_alias="TOKEN_CACHE_TTL_SECONDS")
+
+    # Caché de totales de los listados (X-Total-Count); se invalida al escribir
+    COUNT_CACHE_TTL_SECONDS: float = Field(default=30, validation_alias="COUNT_CACHE_TTL_SECONDS")
+    COUNT_CACHE_MAXSIZE: int = Field(default=1024, validation_alias="COUNT_CACHE_MAXSIZE")
+
+    # Caché de lectura de los catálogos (cursos, aulas, docentes)
+    ENTITY_CACHE_TTL_SECONDS: float = Field(default=60, validation_alias="ENTITY_CACHE_TTL_SECONDS")
+    ENTITY_CACHE_MAXSIZE: int = Field(default=512, validation_alias="ENTITY_CACHE_MAXSIZE")
+
+    # Máximo de documentos por página de los listados (?limit=)
+    LIST_MAX_LIMIT: int = Field(default=1000, validation_alias="LIST_MAX_LIMIT")
+
+    # Máximo de IDs por consulta POST /{recurso}/batch
+    BATCH_MAX_IDS: int = Field(default=200, validation_alias="BATCH_MAX_IDS")
+
+    # Índice de prefijos de /suggest: se recarga desde MongoDB para ver escrituras de otros workers
+    SUGGEST_REFRESH_SECONDS: float = Field(default=300, validation_alias="SUGGEST_REFRESH_SECONDS")
+    SUGGEST_MAX_LIMIT: int = Field(default=50, validation_alias="SUGGEST_MAX_LIMIT")
+
+    # Carga masiva de formularios (POST /forms/bulk)
+    FORMS_BULK_MAX_ITEMS: int = Field(default=1000, gt=0, validation_alias="FORMS_BULK_MAX_ITEMS")
+    FORMS_BULK_CHUNK_SIZE: int = Field(default=500, gt=0, validation_alias="FORMS_BULK_CHUNK_SIZE")
+
+    # Tamaño de lote del cursor de Mongo al exportar formularios
+    FORMS_EXPORT_BATCH_SIZE: int = Field(default=1000, validation_alias="FORMS_EXPORT_BATCH_SIZE")
+
+    # Pool para bcrypt ("thread" o "process") y control de admisión de /auth
+    PASSWORD_HASH_EXECUTOR: str = Field(default="thread", validation_alias="PASSWORD_HASH_EXECUTOR")
+    PASSWORD_HASH_WORKERS: int = Field(default=4, validation_alias="PASSWORD_HASH_WORKERS")
+    AUTH_MAX_CONCURRENCY: int = Field(default=8, validation_alias="AUTH_MAX_CONCURRENCY")
+    AUTH_MAX_QUEUE: int = Field(default=64, validation_alias="AUTH_MAX_QUEUE")
+    AUTH_QUEUE_TIMEOUT_SECONDS: float = Field(default=5, validation_alias="AUTH_QUEUE_TIMEOUT_SECONDS")
+
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
 settings = Settings()
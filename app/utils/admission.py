@@ -0,0 +1,85 @@
+"""
+Admission control for expensive endpoints.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
+from app.exceptions.http_exceptions import ServiceUnavailableException
+
+
+class AdmissionLimiter:
+    """
+    Bounded concurrency limiter with a bounded wait queue.
+
+    Up to ``max_concurrency`` callers run at once; up to ``max_queue`` more wait
+    for at most ``timeout`` seconds. Anything beyond that is rejected with 503.
+    """
+
+    def __init__(self, name: str, max_concurrency: int, max_queue: int, timeout: float):
+        """
+        Initialize the limiter.
+
+        :param name: Name used in error details and stats.
+        :param max_concurrency: Maximum number of callers running at once.
+        :param max_queue: Maximum number of callers waiting for a slot.
+        :param timeout: Maximum time a caller waits for a slot, in seconds.
+        """
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.waiting = 0
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.max_waiting = 0
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        Hold a slot while the body of the ``async with`` block runs.
+
+        :raises ServiceUnavailableException: If the queue is full or the wait times out.
+        """
+        if self._semaphore.locked() and self.waiting >= self.max_queue:
+            self._reject()
+
+        self.waiting += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.timeout)
+        except asyncio.TimeoutError:
+            self._reject()
+        finally:
+            self.waiting -= 1
+
+        self.admitted += 1
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    def _reject(self) -> None:
+        """Count a rejection and raise the 503 error."""
+        self.rejected += 1
+        raise ServiceUnavailableException(self.name)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the limiter counters.
+
+        :return: Limits, current queue depth, in-flight and totals.
+        """
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "queue_depth": self.waiting,
+            "max_queue_depth": self.max_waiting,
+            "in_flight": self.in_flight,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,121 @@
+"""
+Bounded in-process cache with per-entry expiration.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """
+    LRU cache bounded by entry count where every entry expires after a TTL.
+
+    Not shared between worker processes; each worker keeps its own copy.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize the cache.
+
+        :param maxsize: Maximum number of entries kept in memory.
+        :param ttl: Default time to live of an entry, in seconds.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        # Última invalidación de cada clave (contador global), para descartar lecturas que
+        # empezaron antes de una escritura. Acotado a maxsize: una clave olvidada devuelve la
+        # marca más reciente olvidada, que nunca es menor que la que tenía
+        self._invalidations = 0
+        self._invalidated: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._forgotten = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return the cached value for a key, or None if missing or expired.
+
+        :param key: Cache key.
+        :return: The cached value or None.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def generation(self, key: Hashable) -> int:
+        """
+        Return a stamp that changes every time a key is invalidated.
+
+        Read it before loading a value and pass it to ``set``, so a load that
+        overlapped an invalidation does not store the old value.
+
+        :param key: Cache key.
+        :return: Invalidation stamp of the key.
+        """
+        return self._invalidated.get(key, self._forgotten)
+
+    def set(
+        self, key: Hashable, value: Any, ttl: Optional[float] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        :param key: Cache key.
+        :param value: Value to store.
+        :param ttl: Optional TTL overriding the default one, in seconds.
+        :param generation: ``generation(key)`` read before loading the value; if the
+            key was invalidated since, the value is stale and is not stored.
+        """
+        if self.maxsize <= 0:
+            return
+        if generation is not None and generation != self.generation(key):
+            return
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Remove a key from the cache if present.
+
+        :param key: Cache key.
+        """
+        self._data.pop(key, None)
+        self._invalidations += 1
+        self._invalidated[key] = self._invalidations
+        self._invalidated.move_to_end(key)
+        while len(self._invalidated) > self.maxsize:
+            _, self._forgotten = self._invalidated.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the cache counters.
+
+        :return: Size, capacity, hits, misses and hit ratio.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
@@ -14,6 +14,11 @@ DOCS_ROUTE = "/docs"
 REDOC_ROUTE = "/redoc"
 OPENAPI_ROUTE = "/openapi.json"
 
+# Pagination
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+TOTAL_COUNT_ESTIMATE_HEADER = "X-Total-Count-Estimate"
+
 # Classroom Constants
 CLASSROOM = "Classroom"
 CLASSROOM_ID = "The ID of the classroom"
@@ -3,17 +3,84 @@ Base CRUD class for handling common database operations.
 """
 
 from datetime import datetime
-from typing import Generic, TypeVar, List, Optional, Type
+from typing import Any, Dict, Generic, NamedTuple, TypeVar, List, Optional, Tuple, Type, Union
 from pydantic import BaseModel
-from motor.motor_asyncio import AsyncIOMotorDatabase
-from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from bson import ObjectId, json_util
+from pymongo import ASCENDING, IndexModel, ReturnDocument
+from pymongo.errors import BulkWriteError
 from app.exceptions.http_exceptions import NotFoundException
+from app.models.base_model import partial_model
+from app.settings.settings import settings
+from app.utils.cache import TTLCache
+from app.utils.fields import parse_fields
+from app.utils.pagination import encode_cursor, keyset_filter
 
 T = TypeVar("T", bound=BaseModel)  # Modelo de datos basado en Pydantic
 
+def utcnow() -> datetime:
+    """Current UTC time truncated to the millisecond precision BSON stores."""
+    now = datetime.utcnow()
+    return now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+
+# Partial filter shared by indexes that only serve active documents
+ACTIVE_ONLY = {"is_active": True}
+
+# Totales de los listados por (colección, generación, filtro); cada escritura
+# incrementa la generación de su colección y deja las entradas anteriores sin uso
+count_cache = TTLCache(settings.COUNT_CACHE_MAXSIZE, settings.COUNT_CACHE_TTL_SECONDS)
+_count_generations: Dict[str, int] = {}
+
+# Cachés de entidades de los servicios que las activan, por colección
+entity_caches: Dict[str, TTLCache] = {}
+
+
+def entity_cache(collection_name: str) -> TTLCache:
+    """
+    Return the shared read-through cache of a collection, creating it once.
+
+    Services opt in by assigning it to their ``cache`` attribute.
+
+    :param collection_name: Name of the cached collection.
+    :return: Bounded LRU cache with TTL (ENTITY_CACHE_* settings).
+    """
+    if collection_name not in entity_caches:
+        entity_caches[collection_name] = TTLCache(
+            settings.ENTITY_CACHE_MAXSIZE, settings.ENTITY_CACHE_TTL_SECONDS)
+    return entity_caches[collection_name]
+
+
+class HotQuery(NamedTuple):
+    """A query shape whose plan must be index-backed."""
+    name: str
+    filter: dict
+    sort: Optional[List[Tuple[str, int]]] = None
+
+
 class CRUDBase(Generic[T]):
     """Generic CRUD operations for MongoDB collections."""
 
+    # Optional sort key used (together with _id) for keyset pagination
+    sort_field: Optional[str] = None
+
+    # Read-through cache of get_by_id and get_page results (see ``entity_cache``);
+    # None disables it. Writes through this class invalidate it.
+    cache: Optional[TTLCache] = None
+
+    # Fields clients may select with ``fields=``; None allows every model field
+    projectable_fields: Optional[frozenset] = None
+
+    # Indexes created at startup and the queries that must use them
+    indexes: List[IndexModel] = [
+        IndexModel([("is_active", ASCENDING), ("_id", ASCENDING)], name="is_active_id"),
+    ]
+    hot_queries: List[HotQuery] = [
+        HotQuery("list_active", {"is_active": True}, [("_id", ASCENDING)]),
+    ]
+    # Names of indexes replaced by a new declaration, dropped at startup if present
+    dropped_indexes: List[str] = []
+
     def __init__(self, db: AsyncIOMotorDatabase, collection_name: str, model: Type[T]):
         """
         Initialize CRUDBase with a MongoDB collection.
@@ -32,63 +99,269 @@ class CRUDBase(Generic[T]):
 
         :param data: Dictionary representing the document.
         :param created_by: User who created the document.
-        :return: Created document with ID.
+        :return: Created document with ID, built from the inserted data.
         """
         data.update({
         "created_by": created_by,
-        "created_at": datetime.utcnow(),  # Agregar la fecha de creación
+        "created_at": utcnow(),  # Agregar la fecha de creación
         "is_active": True
         })
 
-        result = await self.collection.insert_one(data)
-        return await self.get_by_id(result.inserted_id)
+        # insert_one agrega el _id generado al diccionario
+        await self.collection.insert_one(data)
+        created = self._convert_document(dict(data))
+        self._invalidate_caches(created)
+        await self._on_created(data)
+        return created
+
+    async def create_many(
+        self, items: List[dict], created_by: str, chunk_size: int = 500
+    ) -> List[Union[str, Dict[str, Any]]]:
+        """
+        Insert many documents with unordered ``insert_many`` calls, one per chunk.
+
+        A failing document does not stop the rest of its chunk.
 
-    async def get_by_id(self, document_id: str) -> Optional[T]:
+        :param items: Dictionaries representing the documents.
+        :param created_by: User who created the documents.
+        :param chunk_size: Maximum number of documents sent per round trip.
+        :return: One entry per item, in input order: the new ID, or an error dict.
+        """
+        created_at = utcnow()
+        results: List[Union[str, Dict[str, Any]]] = []
+        for start in range(0, len(items), chunk_size):
+            chunk = items[start:start + chunk_size]
+            for data in chunk:
+                data.update({
+                "created_by": created_by,
+                "created_at": created_at,
+                "is_active": True
+                })
+
+            failed = {}
+            try:
+                await self.collection.insert_many(chunk, ordered=False)
+            except BulkWriteError as exc:
+                for error in exc.details.get("writeErrors", []):
+                    failed[error["index"]] = {"code": error.get("code"), "message": error.get("errmsg")}
+            if len(failed) < len(chunk):
+                self._invalidate_caches()
+
+            # insert_many agrega el _id generado a cada diccionario
+            results.extend(
+                failed.get(index) or str(data["_id"]) for index, data in enumerate(chunk))
+            await self._on_created_many(
+                [data for index, data in enumerate(chunk) if index not in failed])
+        return results
+
+    async def get_by_id(
+        self, document_id: str, fields: Optional[List[str]] = None
+    ) -> Optional[T]:
         """
         Retrieve a document by its ID.
 
         :param document_id: The document ID.
+        :param fields: Only read these fields (see ``parse_fields``).
         :return: The document or None if not found.
         """
         object_id = self._get_valid_object_id(document_id)
         if not object_id:
             return None
 
-        document = await self.collection.find_one({"_id": object_id, "is_active": True})
-        return self._convert_document(document)
+        key = self._entity_key(document_id, fields)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        document = await self.collection.find_one(
+            {"_id": object_id, "is_active": True}, self._projection(fields))
+        result = self._convert_document(document, fields)
+        if self.cache is not None and result is not None:
+            self.cache.set(key, result)
+        return result
 
-    async def get_by_id_or_raise(self, document_id: str, resource_name: str) -> T:
+    async def get_by_id_or_raise(
+        self, document_id: str, resource_name: str, fields: Optional[List[str]] = None
+    ) -> T:
         """
         Retrieve a document by ID or raise a NotFoundException.
 
         :param document_id: The document ID.
         :param resource_name: The name of the resource (for error messages).
+        :param fields: Only read these fields (see ``parse_fields``).
         :return: The document if found.
         :raises NotFoundException: If the document does not exist.
         """
-        document = await self.get_by_id(document_id)
+        document = await self.get_by_id(document_id, fields)
         if not document:
             raise NotFoundException(resource_name, document_id)
         return document
 
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[T]:
+    async def get_many(
+        self, document_ids: List[str], fields: Optional[List[str]] = None
+    ) -> Tuple[List[T], List[str]]:
+        """
+        Retrieve several active documents with a single ``$in`` query.
+
+        Repeated IDs are returned once; invalid or unknown IDs are reported as missing.
+
+        :param document_ids: The document IDs.
+        :param fields: Only read these fields (see ``parse_fields``).
+        :return: Tuple with the documents found, in input order, and the missing IDs.
+        """
+        document_ids = list(dict.fromkeys(document_ids))
+        found: Dict[str, T] = {}
+        pending: Dict[ObjectId, str] = {}
+        for document_id in document_ids:
+            if self.cache is not None:
+                cached = self.cache.get(self._entity_key(document_id, fields))
+                if cached is not None:
+                    found[document_id] = cached
+                    continue
+            object_id = self._get_valid_object_id(document_id)
+            if object_id:
+                pending[object_id] = document_id
+
+        if pending:
+            documents = await self.collection.find(
+                {"_id": {"$in": list(pending)}, "is_active": True}, self._projection(fields)
+            ).to_list(length=len(pending))
+            for document in documents:
+                document_id = pending[document["_id"]]
+                found[document_id] = self._convert_document(document, fields)
+                if self.cache is not None:
+                    self.cache.set(self._entity_key(document_id, fields), found[document_id])
+
+        items = [found[document_id] for document_id in document_ids if document_id in found]
+        missing = [document_id for document_id in document_ids if document_id not in found]
+        return items, missing
+
+    async def get_all(
+        self, skip: int = 0, limit: int = 100, fields: Optional[List[str]] = None
+    ) -> List[T]:
         """
         Retrieve all active documents with pagination.
 
         :param skip: Number of documents to skip.
         :param limit: Maximum number of documents to return.
+        :param fields: Only read these fields (see ``parse_fields``).
         :return: List of documents.
         """
-        cursor = self.collection.find({"is_active": True}).skip(skip).limit(limit)
-        return [self._convert_document(doc) async for doc in cursor]
+        items, _ = await self.get_page(skip=skip, limit=limit, fields=fields)
+        return items
+
+    async def get_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        query: Optional[dict] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[T], Optional[str]]:
+        """
+        Retrieve a page of active documents ordered by the sort key and _id.
+
+        When a cursor is given the page starts right after the document it
+        points to and ``skip`` is ignored, so the cost of a page does not
+        depend on how deep the client has paged.
+
+        :param skip: Number of documents to skip (legacy offset pagination).
+        :param limit: Maximum number of documents to return.
+        :param cursor: Opaque cursor returned with the previous page.
+        :param query: Extra filter applied on top of ``is_active``.
+        :param fields: Only read these fields (see ``parse_fields``).
+        :return: Tuple with the documents and the cursor of the next page.
+        """
+        if limit < 1:
+            return [], None  # No hay último documento con el que construir el cursor
+
+        key = ("page", skip, limit, cursor, json_util.dumps(query or {}, sort_keys=True),
+               tuple(fields) if fields else None)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        filters = {"is_active": True, **(query or {})}
+        if cursor:
+            filters.update(keyset_filter(cursor, self.sort_field))
+
+        sort = [("_id", 1)]
+        if self.sort_field:
+            sort.insert(0, (self.sort_field, 1))
+
+        projection = self._projection(fields)
+        if projection and self.sort_field:
+            projection[self.sort_field] = 1  # Necesario para construir el cursor
+        find = self.collection.find(filters, projection).sort(sort)
+        if skip and not cursor:
+            find = find.skip(skip)
+        documents = await find.limit(limit + 1).to_list(length=limit + 1)
+
+        documents, next_cursor = self._trim_page(documents, limit, self.sort_field)
+        page = [self._convert_document(doc, fields) for doc in documents], next_cursor
+        if self.cache is not None:
+            self.cache.set(key, page)
+        return page
+
+    @staticmethod
+    def _trim_page(
+        documents: List[dict], limit: int, sort_field: Optional[str] = None
+    ) -> Tuple[List[dict], Optional[str]]:
+        """
+        Cut documents read with ``limit + 1`` down to a page and build the next cursor.
+
+        :param documents: Documents read, one more than the page size if there are more.
+        :param limit: Page size (at least 1).
+        :param sort_field: Sort key stored in the cursor together with ``_id``.
+        :return: Tuple with the page documents and the cursor of the next page.
+        """
+        if len(documents) <= limit:
+            return documents, None
+        documents = documents[:limit]
+        last = documents[-1]
+        return documents, encode_cursor(last["_id"], last.get(sort_field) if sort_field else None)
+
+    async def count(self, query: Optional[dict] = None, estimated: bool = False) -> int:
+        """
+        Count the active documents matching a filter, cached for a few seconds.
+
+        The cache key includes the whole filter, so role scoping (e.g. a teacher's
+        ``cedula``) is kept apart, and any write through this class invalidates the
+        counts of its collection.
+
+        :param query: Extra filter applied on top of ``is_active``.
+        :param estimated: For unfiltered listings, read the collection metadata with
+            ``estimated_document_count`` instead of counting. The figure includes
+            disabled documents.
+        :return: Number of documents.
+        """
+        estimated = estimated and not query
+        filters = {"is_active": True, **(query or {})}
+        name = self.collection.name
+        key = (name, _count_generations.get(name, 0), estimated,
+               json_util.dumps(filters, sort_keys=True))
 
-    async def update(self, document_id: str, data: dict, updated_by: str) -> Optional[T]:
+        total = count_cache.get(key)
+        if total is None:
+            if estimated:
+                total = await self.collection.estimated_document_count()
+            else:
+                total = await self.collection.count_documents(filters)
+            count_cache.set(key, total)
+        return total
+
+    async def update(
+        self, document_id: str, data: dict, updated_by: str, query: Optional[dict] = None
+    ) -> Optional[T]:
         """
-        Update an existing document.
+        Update an existing document and return its after-image in one round trip.
 
         :param document_id: The document ID.
         :param data: Dictionary with updated fields.
         :param updated_by: User who is updating the document.
+        :param query: Extra filter the document must match (e.g. ownership).
         :return: The updated document or None if not found.
         """
         object_id = self._get_valid_object_id(document_id)
@@ -97,17 +370,22 @@ class CRUDBase(Generic[T]):
 
         data.update({
         "updated_by": updated_by,
-        "updated_at": datetime.utcnow()
+        "updated_at": utcnow()
         })
 
-        update_result = await self.collection.update_one(
-            {"_id": object_id, "is_active": True},
-            {"$set": data}
+        # Se pide la imagen previa para los hooks; la posterior es la previa con el $set aplicado
+        before = await self.collection.find_one_and_update(
+            {**(query or {}), "_id": object_id, "is_active": True},
+            {"$set": data},
+            return_document=ReturnDocument.BEFORE
         )
-        if update_result.matched_count == 0:
+        if before is None:
             return None
-
-        return await self.get_by_id(document_id)
+        after = {**before, **data}
+        updated = self._convert_document(dict(after))
+        self._invalidate_caches(updated)
+        await self._on_updated(before, after)
+        return updated
 
     async def delete(self, document_id: str, deleted_by: str) -> bool:
         """
@@ -121,11 +399,86 @@ class CRUDBase(Generic[T]):
         if not object_id:
             return False
 
-        delete_result = await self.collection.update_one(
+        before = await self.collection.find_one_and_update(
             {"_id": object_id, "is_active": True},
-            {"$set": {"is_active": False, "deleted_by": deleted_by}}
+            {"$set": {"is_active": False, "deleted_by": deleted_by}},
+            return_document=ReturnDocument.BEFORE
         )
-        return delete_result.matched_count > 0
+        if before is None:
+            return False
+        self._invalidate_caches()
+        await self._on_deleted(before)
+        return True
+
+    def _invalidate_caches(self, written: Optional[T] = None) -> None:
+        """
+        Discard the cached counts and entities of this collection after a write.
+
+        :param written: The document as it now is, written back to the entity cache
+            unless it was disabled (get_by_id only returns active documents).
+        """
+        name = self.collection.name
+        _count_generations[name] = _count_generations.get(name, 0) + 1
+        if self.cache is not None:
+            # Las páginas cacheadas pueden incluir el documento: se descarta todo
+            self.cache.clear()
+            if written is not None and written.is_active:
+                self.cache.set(self._entity_key(written.id), written)
+
+    async def _on_created(self, document: dict) -> None:
+        """
+        Hook called after a document is inserted. No-op by default.
+
+        :param document: The inserted document, with its ObjectId.
+        """
+
+    async def _on_created_many(self, documents: List[dict]) -> None:
+        """
+        Hook called after a bulk insert with the documents that were written.
+
+        :param documents: The inserted documents, with their ObjectIds.
+        """
+        for document in documents:
+            await self._on_created(document)
+
+    async def _on_updated(self, before: dict, after: dict) -> None:
+        """
+        Hook called after a document is updated. No-op by default.
+
+        :param before: The document before the update.
+        :param after: The document after the update.
+        """
+
+    async def _on_deleted(self, document: dict) -> None:
+        """
+        Hook called after a document is soft deleted. No-op by default.
+
+        :param document: The document as it was before the deletion.
+        """
+
+    async def ensure_indexes(self) -> List[str]:
+        """
+        Create the indexes declared for this service (no-op if they already exist)
+        and drop the ones listed in ``dropped_indexes``.
+
+        :return: Names of the indexes on the collection.
+        """
+        if self.dropped_indexes:
+            existing = await self.collection.index_information()
+            for name in self.dropped_indexes:
+                if name in existing:
+                    await self.collection.drop_index(name)
+        if not self.indexes:
+            return []
+        return await self.collection.create_indexes(self.indexes)
+
+    async def find_collection_scans(self) -> List[str]:
+        """
+        Run ``explain()`` on every registered hot query.
+
+        :return: Names of the hot queries whose winning plan is a COLLSCAN.
+        """
+        return await find_collection_scans(self.collection, self.hot_queries)
 
     def _get_valid_object_id(self, document_id: str) -> Optional[ObjectId]:
         """
@@ -136,14 +489,79 @@ class CRUDBase(Generic[T]):
         """
         return ObjectId(document_id) if ObjectId.is_valid(document_id) else None
 
-    def _convert_document(self, document: Optional[dict]) -> Optional[T]:
+    def parse_fields(self, fields: Optional[str]) -> Optional[List[str]]:
+        """
+        Validate a ``fields=`` query parameter against this service's allowlist.
+
+        :param fields: Comma separated field names.
+        :return: The requested fields, or None for full documents.
+        :raises BadRequestException: If a field is not allowed.
+        """
+        return parse_fields(fields, self.projectable_fields or self.model.model_fields)
+
+    @staticmethod
+    def _entity_key(document_id: str, fields: Optional[List[str]] = None) -> tuple:
+        """Key of a single document in the entity cache."""
+        return ("id", document_id, tuple(fields) if fields else None)
+
+    def _projection(self, fields: Optional[List[str]]) -> Optional[dict]:
+        """
+        Build a MongoDB projection for the requested fields (``_id`` is always returned).
+
+        :param fields: Requested field names, or None for full documents.
+        :return: Projection document or None.
+        """
+        if not fields:
+            return None
+        return {field: 1 for field in fields}
+
+    def _convert_document(
+        self, document: Optional[dict], fields: Optional[List[str]] = None
+    ) -> Optional[T]:
         """
         Convert a MongoDB document to a Pydantic model.
 
         :param document: The document to convert.
+        :param fields: Fields the document was projected to; uses the partial model.
         :return: A Pydantic model or None if document is None.
         """
         if not document:
             return None
         document["_id"] = str(document["_id"])  # Convert ObjectId to string
-        return self.model(**document)
+        # Una sola validación (en el núcleo de pydantic); FastAPI no vuelve a validar
+        # instancias del response_model y las serializa directamente a JSON
+        model = partial_model(self.model) if fields else self.model
+        return model.model_validate(document)
+
+
+async def find_collection_scans(
+    collection: AsyncIOMotorCollection, hot_queries: List[HotQuery]
+) -> List[str]:
+    """
+    Run ``explain()`` on each hot query of a collection.
+
+    :param collection: The collection to explain the queries on.
+    :param hot_queries: Query shapes that must be index-backed.
+    :return: Names of the hot queries whose winning plan is a COLLSCAN.
+    """
+    offenders = []
+    for hot_query in hot_queries:
+        cursor = collection.find(hot_query.filter)
+        if hot_query.sort:
+            cursor = cursor.sort(hot_query.sort)
+        plan = await cursor.limit(1).explain()
+        winning_plan = plan.get("queryPlanner", {}).get("winningPlan", {})
+        if _has_stage(winning_plan, "COLLSCAN"):
+            offenders.append(f"{collection.name}.{hot_query.name}")
+    return offenders
+
+
+def _has_stage(plan: Any, stage: str) -> bool:
+    """Check recursively whether a query plan contains the given stage."""
+    if isinstance(plan, dict):
+        if plan.get("stage") == stage:
+            return True
+        return any(_has_stage(value, stage) for value in plan.values())
+    if isinstance(plan, list):
+        return any(_has_stage(value, stage) for value in plan)
+    return False
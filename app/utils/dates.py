@@ -0,0 +1,117 @@
+"""
+Parsing of the date and time formats accepted from clients.
+
+Values are normalized to naive UTC datetimes, which is how BSON dates are
+stored and read back by the driver.
+"""
+
+from datetime import date, datetime, time, timezone
+from typing import Any, Callable, Optional
+
+# Fecha sin hora a la que se anclan las horas del día (BSON no tiene tipo "time")
+TIME_ANCHOR = date(1970, 1, 1)
+
+DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%Y/%m/%d")
+TIME_FORMATS = ("%H:%M", "%H:%M:%S", "%I:%M %p", "%I:%M:%S %p", "%I:%M%p")
+
+
+def _to_naive_utc(value: datetime) -> datetime:
+    """Convert an aware datetime to naive UTC; naive values are kept as they are."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _parse_iso_datetime(value: str) -> Optional[datetime]:
+    """Parse an ISO 8601 datetime, or return None if the text is not one."""
+    try:
+        return _to_naive_utc(datetime.fromisoformat(value.replace("Z", "+00:00")))
+    except ValueError:
+        return None
+
+
+def parse_date(value: Any) -> Any:
+    """
+    Parse a calendar date into a datetime at midnight.
+
+    :param value: datetime, date or text (YYYY-MM-DD, DD/MM/YYYY, ISO datetime...).
+    :return: The parsed datetime; other values are returned unchanged.
+    :raises ValueError: If the text does not match any accepted format.
+    """
+    if isinstance(value, datetime):
+        return _to_naive_utc(value)
+    if isinstance(value, date):
+        return datetime.combine(value, time.min)
+    if not isinstance(value, str):
+        return value
+
+    text = value.strip()
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    parsed = _parse_iso_datetime(text)
+    if parsed is None:
+        raise ValueError(f"Invalid date: {value!r}")
+    return datetime.combine(parsed.date(), time.min)
+
+
+def parse_time(value: Any) -> Any:
+    """
+    Parse a time of day, anchored on TIME_ANCHOR, or a full timestamp.
+
+    :param value: datetime, time or text (HH:MM, HH:MM:SS, 08:00 AM, ISO datetime...).
+    :return: The parsed datetime; other values are returned unchanged.
+    :raises ValueError: If the text does not match any accepted format.
+    """
+    if isinstance(value, datetime):
+        return _to_naive_utc(value)
+    if isinstance(value, time):
+        return datetime.combine(TIME_ANCHOR, value.replace(tzinfo=None))
+    if not isinstance(value, str):
+        return value
+
+    text = value.strip()
+    for fmt in TIME_FORMATS:
+        try:
+            return datetime.combine(TIME_ANCHOR, datetime.strptime(text.upper(), fmt).time())
+        except ValueError:
+            continue
+    parsed = _parse_iso_datetime(text)
+    if parsed is None:
+        raise ValueError(f"Invalid time: {value!r}")
+    return parsed
+
+
+def parse_stored(parser: Callable[[Any], Any], value: Any) -> Any:
+    """
+    Parse a value read from MongoDB, keeping legacy text that cannot be parsed.
+
+    :param parser: parse_date or parse_time.
+    :param value: Stored value.
+    :return: The parsed datetime, or the original value if it is not valid.
+    """
+    try:
+        return parser(value)
+    except ValueError:
+        return value
+
+
+def format_date(value: Any) -> Any:
+    """Format a stored date as YYYY-MM-DD; legacy text is returned as it is."""
+    if not isinstance(value, datetime):
+        return value
+    return value.strftime("%Y-%m-%d")
+
+
+def format_time(value: Any) -> Any:
+    """
+    Format a stored time as HH:MM[:SS], or as ISO text if it carries a real date.
+    Legacy text is returned as it is.
+    """
+    if not isinstance(value, datetime):
+        return value
+    if value.date() != TIME_ANCHOR:
+        return value.isoformat()
+    return value.strftime("%H:%M:%S" if value.second else "%H:%M")
@@ -0,0 +1,98 @@
+"""
+Streaming encoders used to export large collections without materializing them.
+"""
+
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, List, Optional
+from bson import ObjectId
+
+# Rows encoded before handing a chunk to the response
+ROWS_PER_CHUNK = 500
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize the BSON types that the json module does not know."""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _row(document: dict, fields: List[str], formatters: Optional[Dict[str, Callable]]) -> dict:
+    """Keep the exported fields of a document, formatted like the API responses."""
+    row = {field: document.get(field) for field in fields}
+    for field, formatter in (formatters or {}).items():
+        if row.get(field) is not None:
+            row[field] = formatter(row[field])
+    return row
+
+
+async def csv_chunks(
+    documents: AsyncIterable[dict],
+    fields: List[str],
+    formatters: Optional[Dict[str, Callable]] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Encode documents as CSV, header included.
+
+    :param documents: Async iterable of MongoDB documents.
+    :param fields: Columns to write, in order.
+    :param formatters: Function applied to the (non-null) value of some columns.
+    :return: Async iterator of encoded chunks.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction="ignore")
+    writer.writeheader()
+    rows = 0
+    async for document in documents:
+        writer.writerow(_row(document, fields, formatters))
+        rows += 1
+        if rows % ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode("utf-8")
+
+
+async def ndjson_chunks(
+    documents: AsyncIterable[dict],
+    fields: List[str],
+    formatters: Optional[Dict[str, Callable]] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Encode documents as newline-delimited JSON.
+
+    :param documents: Async iterable of MongoDB documents.
+    :param fields: Keys to keep from each document, in order.
+    :param formatters: Function applied to the (non-null) value of some keys.
+    :return: Async iterator of encoded chunks.
+    """
+    lines = []
+    async for document in documents:
+        row = _row(document, fields, formatters)
+        lines.append(json.dumps(row, default=_json_default, ensure_ascii=False))
+        if len(lines) == ROWS_PER_CHUNK:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+async def gzip_chunks(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """
+    Compress a stream of chunks into a single gzip member.
+
+    :param chunks: Async iterable of raw chunks.
+    :return: Async iterator of compressed chunks.
+    """
+    compressor = zlib.compressobj(wbits=31)  # 31 = formato gzip
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
@@ -0,0 +1,59 @@
+"""
+Sparse fieldsets: ``fields=`` query parameter parsing and partial responses.
+"""
+
+from typing import Iterable, List, Mapping, Optional
+from fastapi import Response
+from pydantic import BaseModel
+from app.exceptions.http_exceptions import BadRequestException
+
+
+def parse_fields(fields: Optional[str], allowed: Iterable[str]) -> Optional[List[str]]:
+    """
+    Parse a comma separated ``fields`` parameter against an allowlist.
+
+    :param fields: Raw parameter value, e.g. ``"fecha,cedula,cantidadHoras"``.
+    :param allowed: Field names that may be requested.
+    :return: Requested field names, or None when the full document is wanted.
+    :raises BadRequestException: If a field is not in the allowlist.
+    """
+    if not fields:
+        return None
+    allowed = set(allowed)
+    requested = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in requested if name not in allowed]
+    if unknown:
+        raise BadRequestException(
+            "Unknown fields requested", "INVALID_FIELDS",
+            {"fields": unknown, "allowed": sorted(allowed)})
+    return requested or None
+
+
+def partial_response(
+    content, fields: List[str], headers: Optional[Mapping[str, Optional[str]]] = None
+) -> Response:
+    """
+    Serialize partial models keeping only the requested fields (and the id).
+
+    Returned directly so FastAPI does not validate it against the full response_model;
+    the JSON is written by pydantic, without an intermediate dict.
+
+    :param content: A partial model or a list of them.
+    :param fields: Requested field names.
+    :param headers: Extra response headers; None values are skipped.
+    :return: JSON response.
+    """
+    include = set(fields) | {"id"}
+
+    def dump(item: BaseModel) -> str:
+        return item.model_dump_json(by_alias=True, include=include)
+
+    if isinstance(content, list):
+        body = "[" + ",".join(dump(item) for item in content) + "]"
+    else:
+        body = dump(content)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={name: value for name, value in (headers or {}).items() if value},
+    )
@@ -0,0 +1,173 @@
+"""
+Lightweight in-process metrics.
+"""
+
+import bisect
+import threading
+from typing import Dict, List, Sequence, Tuple
+
+
+class LatencyStats:
+    """Running count, total and maximum of observed durations (in seconds)."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """
+        Record one observation.
+
+        :param seconds: Observed duration in seconds.
+        """
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Return the aggregated values in milliseconds.
+
+        :return: Count, mean and maximum latency.
+        """
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "max_ms": self.max * 1000,
+        }
+
+
+# Límites (en segundos) de los buckets de latencia expuestos en /metrics
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Métricas que se publican en formato Prometheus, en orden de registro
+registry: List["LabeledMetric"] = []
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    """Render a label set as ``{name="value",...}``."""
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class LabeledMetric:
+    """Base of the metrics rendered by ``render_prometheus``; thread safe."""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str]):
+        """
+        Create the metric and add it to the registry.
+
+        :param name: Metric name, e.g. ``mongodb_command_duration_seconds``.
+        :param documentation: HELP text.
+        :param label_names: Names of the labels every observation carries.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+        registry.append(self)
+
+    def render(self) -> List[str]:
+        """Return the HELP/TYPE header lines; subclasses append their samples."""
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+
+
+class CounterMetric(LabeledMetric):
+    """Monotonic counter per label set."""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str]):
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, labels: Tuple[str, ...], amount: float = 1) -> None:
+        """
+        Increment the counter of a label set.
+
+        :param labels: Label values, in ``label_names`` order.
+        :param amount: Increment.
+        """
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return super().render() + [
+            f"{self.name}{_format_labels(self.label_names, labels)} {value}"
+            for labels, value in values
+        ]
+
+
+class Histogram(LabeledMetric):
+    """Cumulative histogram of durations (in seconds) per label set."""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # Por etiqueta: conteo por bucket (no acumulado), suma y total
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, labels: Tuple[str, ...], seconds: float) -> None:
+        """
+        Record one observation.
+
+        :param labels: Label values, in ``label_names`` order.
+        :param seconds: Observed duration in seconds.
+        """
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += seconds
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = sorted((labels, (list(counts), total, count))
+                            for labels, (counts, total, count) in self._series.items())
+        lines = super().render()
+        for labels, (counts, total, count) in series:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                le = _format_labels(self.label_names, labels, f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            le = _format_labels(self.label_names, labels, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{le} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, labels)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, labels)} {count}")
+        return lines
+
+
+def render_prometheus() -> str:
+    """
+    Render every registered metric in the Prometheus text exposition format.
+
+    :return: Text body for a ``/metrics`` response.
+    """
+    lines: List[str] = []
+    for metric in registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
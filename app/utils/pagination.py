@@ -0,0 +1,110 @@
+"""
+Opaque cursor helpers for keyset pagination.
+
+A cursor encodes the sort key and the ``_id`` of the last document of a page,
+so the next page can be fetched with an indexed range query instead of
+``skip``, which forces MongoDB to walk every skipped document.
+"""
+
+import base64
+import binascii
+from typing import Any, Dict, Optional, Tuple
+from bson import ObjectId, json_util
+from fastapi import Response
+from app.exceptions.http_exceptions import BadRequestException
+from app.utils.constants import (
+    NEXT_CURSOR_HEADER, TOTAL_COUNT_ESTIMATE_HEADER, TOTAL_COUNT_HEADER)
+
+
+def encode_cursor(last_id: ObjectId, sort_value: Any = None) -> str:
+    """
+    Build an opaque cursor from the last document of a page.
+
+    :param last_id: ``_id`` of the last document returned.
+    :param sort_value: Value of the sort key for that document, if any.
+    :return: URL-safe cursor string.
+    """
+    raw = json_util.dumps({"id": last_id, "v": sort_value})
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[ObjectId, Any]:
+    """
+    Decode a cursor produced by :func:`encode_cursor`.
+
+    :param cursor: Cursor string received from the client.
+    :return: Tuple ``(last_id, sort_value)``.
+    :raises BadRequestException: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json_util.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        last_id = data["id"]
+        if not isinstance(last_id, ObjectId):
+            raise ValueError("cursor id is not an ObjectId")
+        return last_id, data.get("v")
+    except (ValueError, KeyError, TypeError, binascii.Error) as exc:
+        raise BadRequestException(
+            "Invalid pagination cursor", "INVALID_CURSOR", {"cursor": cursor}
+        ) from exc
+
+
+def keyset_filter(cursor: str, sort_field: Optional[str] = None) -> dict:
+    """
+    Translate a cursor into the range filter that selects the following page.
+
+    :param cursor: Cursor string received from the client.
+    :param sort_field: Optional sort key used together with ``_id``.
+    :return: MongoDB filter fragment.
+    """
+    last_id, sort_value = decode_cursor(cursor)
+    if not sort_field:
+        return {"_id": {"$gt": last_id}}
+    following = [
+        {sort_field: {"$gt": sort_value}},
+        {sort_field: sort_value, "_id": {"$gt": last_id}},
+    ]
+    # $gt solo compara valores del mismo tipo, pero el orden de MongoDB pone null antes
+    # que los textos y los textos antes que las fechas (p. ej. fechas legadas sin migrar)
+    if sort_value is None:
+        following.append({sort_field: {"$ne": None}})
+    elif isinstance(sort_value, str):
+        following.append({sort_field: {"$type": "date"}})
+    return {"$or": following}
+
+
+def page_headers(
+    next_cursor: Optional[str], total: Optional[int] = None, estimated: bool = False
+) -> Dict[str, str]:
+    """
+    Build the pagination headers of a list response.
+
+    :param next_cursor: Cursor for the next page, or None on the last page.
+    :param total: Total number of matching documents, if known.
+    :param estimated: Whether ``total`` comes from the collection metadata; it is then
+        sent as X-Total-Count-Estimate instead of X-Total-Count.
+    :return: Headers with the next cursor and the total count.
+    """
+    headers = {}
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    if total is not None:
+        headers[TOTAL_COUNT_ESTIMATE_HEADER if estimated else TOTAL_COUNT_HEADER] = str(total)
+    return headers
+
+
+def set_page_headers(
+    response: Response,
+    next_cursor: Optional[str],
+    total: Optional[int] = None,
+    estimated: bool = False,
+) -> None:
+    """
+    Expose the next cursor and the total count to the client through the response headers.
+
+    :param response: The outgoing response.
+    :param next_cursor: Cursor for the next page, or None on the last page.
+    :param total: Total number of matching documents, if known.
+    :param estimated: Whether ``total`` is an estimate (see ``page_headers``).
+    """
+    response.headers.update(page_headers(next_cursor, total, estimated))
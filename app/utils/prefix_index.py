@@ -0,0 +1,138 @@
+"""
+In-memory prefix index used by the ``/suggest`` endpoints.
+
+Keys are normalized (accents removed, case folded) and kept in a sorted array,
+so a lookup is a binary search followed by a short scan of the matching keys.
+"""
+
+import time
+import unicodedata
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+def normalize(text: str) -> str:
+    """
+    Fold a text for case- and accent-insensitive matching.
+
+    :param text: Original text.
+    :return: Lowercase text without diacritics and with single spaces.
+    """
+    decomposed = unicodedata.normalize("NFKD", str(text))
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def word_suffixes(text: str) -> List[str]:
+    """
+    Return the text starting at each of its words, so any word can be the prefix.
+
+    :param text: e.g. "Ana María Pérez".
+    :return: e.g. ["ana maria perez", "maria perez", "perez"].
+    """
+    words = normalize(text).split()
+    return [" ".join(words[start:]) for start in range(len(words))]
+
+
+class PrefixIndex:
+    """Sorted array of (key, entry id) pairs with the value of each entry."""
+
+    def __init__(self):
+        self._keys: List[Tuple[str, str]] = []
+        self._entries: Dict[str, Tuple[Any, List[str]]] = {}
+        self.loaded_at: Optional[float] = None
+        self.refreshing = False
+        # Contador de escrituras locales y generación de la última escritura de cada entrada,
+        # para que una recarga leída antes de una escritura no la deshaga
+        self.generation = 0
+        self._written: Dict[str, int] = {}
+
+    def rebuild(
+        self, entries: Iterable[Tuple[str, Any, Iterable[str]]], since: Optional[int] = None
+    ) -> None:
+        """
+        Replace the whole index.
+
+        :param entries: (entry id, value, keys) for every entry.
+        :param since: ``generation`` when the entries started being read. Entries
+            upserted or removed after it keep their current state instead of the
+            (older) one in ``entries``.
+        """
+        newer = set() if since is None else {
+            entry_id for entry_id, generation in self._written.items() if generation > since}
+        keys, values = [], {}
+        for entry_id, value, entry_keys in entries:
+            if entry_id not in newer:
+                values[entry_id] = (value, sorted({normalize(key) for key in entry_keys if key}))
+        for entry_id in newer:
+            if entry_id in self._entries:
+                values[entry_id] = self._entries[entry_id]
+        for entry_id, (_, normalized) in values.items():
+            keys.extend((key, entry_id) for key in normalized)
+        keys.sort()
+        self._keys, self._entries = keys, values
+        self._written = {entry_id: self._written[entry_id] for entry_id in newer}
+        self.loaded_at = time.monotonic()
+
+    def upsert(self, entry_id: str, value: Any, keys: Iterable[str]) -> None:
+        """
+        Add an entry or replace its value and keys.
+
+        :param entry_id: Entry identifier (the document ``_id``).
+        :param value: Object returned by ``search``.
+        :param keys: Texts the entry can be found by.
+        """
+        self.remove(entry_id)
+        normalized = sorted({normalize(key) for key in keys if key})
+        self._entries[entry_id] = (value, normalized)
+        for key in normalized:
+            insort(self._keys, (key, entry_id))
+
+    def remove(self, entry_id: str) -> None:
+        """
+        Remove an entry, if present.
+
+        :param entry_id: Entry identifier.
+        """
+        self.generation += 1
+        self._written[entry_id] = self.generation
+        entry = self._entries.pop(entry_id, None)
+        if entry is None:
+            return
+        for key in entry[1]:
+            position = bisect_left(self._keys, (key, entry_id))
+            if position < len(self._keys) and self._keys[position] == (key, entry_id):
+                del self._keys[position]
+
+    def search(self, prefix: str, limit: int) -> List[Any]:
+        """
+        Return the values of the entries with a key starting with the prefix.
+
+        :param prefix: Text typed by the user.
+        :param limit: Maximum number of entries.
+        :return: Matching values, ordered by the matched key.
+        """
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        found: Dict[str, Any] = {}
+        position = bisect_left(self._keys, (prefix, ""))
+        while position < len(self._keys) and len(found) < limit:
+            key, entry_id = self._keys[position]
+            if not key.startswith(prefix):
+                break
+            if entry_id not in found:
+                found[entry_id] = self._entries[entry_id][0]
+            position += 1
+        return list(found.values())
+
+    def is_stale(self, max_age: float) -> bool:
+        """
+        Check whether the index was never built or was built too long ago.
+
+        :param max_age: Maximum age in seconds.
+        """
+        return self.loaded_at is None or time.monotonic() - self.loaded_at > max_age
+
+    def __len__(self) -> int:
+        return len(self._entries)
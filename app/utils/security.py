@@ -1,12 +1,19 @@
 """Help to authenticate"""
 
+import asyncio
+import hashlib
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from typing import Callable, Optional, TypeVar
 from fastapi import HTTPException, Request
 from passlib.context import CryptContext
 import jwt
 from app.exceptions.http_exceptions import UnauthorizedException
 from app.settings.settings import settings
+from app.utils.cache import TTLCache
 from app.utils.constants import ADMIN, TEACHER
+from app.utils.metrics import LatencyStats
 
 # Fetch values from the settings
 SECRET_KEY = settings.SECRET_KEY
@@ -16,6 +23,15 @@ ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 # Initialize password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Pool where bcrypt runs so it never blocks the event loop
+_hash_executor: Optional[Executor] = None
+hash_latency = LatencyStats()
+
+# Payloads of already verified tokens, keyed by token digest, until their exp
+token_cache = TTLCache(settings.TOKEN_CACHE_MAXSIZE, settings.TOKEN_CACHE_TTL_SECONDS)
+
+R = TypeVar("R")
+
 def hash_password(password: str) -> str:
     """
     Generates a hashed password using bcrypt.
@@ -35,6 +51,64 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     return pwd_context.verify(plain_password, hashed_password)
 
+def _get_hash_executor() -> Executor:
+    """
+    Return the executor used for password hashing, creating it on first use.
+
+    :return: Thread or process pool, according to PASSWORD_HASH_EXECUTOR.
+    """
+    global _hash_executor  # pylint: disable=global-statement
+    if _hash_executor is None:
+        workers = settings.PASSWORD_HASH_WORKERS
+        if settings.PASSWORD_HASH_EXECUTOR == "process":
+            _hash_executor = ProcessPoolExecutor(max_workers=workers)
+        else:
+            _hash_executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="password-hash")
+    return _hash_executor
+
+async def _run_in_hash_executor(func: Callable[..., R], *args) -> R:
+    """
+    Run a hashing function in the hash pool and record its latency.
+
+    :param func: Function to run.
+    :return: The function result.
+    """
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+    try:
+        return await loop.run_in_executor(_get_hash_executor(), func, *args)
+    finally:
+        hash_latency.observe(time.perf_counter() - start)
+
+async def hash_password_async(password: str) -> str:
+    """
+    Generates a hashed password without blocking the event loop.
+
+    :param password: Plain text password.
+    :return: Hashed password.
+    """
+    return await _run_in_hash_executor(hash_password, password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verifies a password against its hash without blocking the event loop.
+
+    :param plain_password: Plain text password.
+    :param hashed_password: Hashed password.
+    :return: True if passwords match, False otherwise.
+    """
+    return await _run_in_hash_executor(verify_password, plain_password, hashed_password)
+
+def shutdown_hash_executor() -> None:
+    """
+    Shuts down the password hashing pool, if it was started.
+    """
+    global _hash_executor  # pylint: disable=global-statement
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=False)
+        _hash_executor = None
+
 def create_access_token(data: dict, expires_delta: timedelta = None):
     """
     Generates a JWT access token with expiration.
@@ -51,6 +125,30 @@ def create_access_token(data: dict, expires_delta: timedelta = None):
 def decode_access_token(token: str):
     """
     Decodes a JWT access token and returns the payload.
+    The signature is verified once per token; later calls are served from
+    ``token_cache`` until the token expires.
+
+    :param token: Encoded JWT token.
+    :return: Decoded payload data.
+    :raises UnauthorizedException: If token is expired or invalid.
+    """
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    payload = token_cache.get(key)
+    if payload is not None:
+        if "exp" in payload and payload["exp"] <= time.time():
+            token_cache.invalidate(key)
+            raise UnauthorizedException("Token expired")
+        return dict(payload)
+
+    payload = _verify_access_token(token)
+    ttl = payload["exp"] - time.time() if "exp" in payload else None
+    if ttl is None or ttl > 0:
+        token_cache.set(key, payload, ttl)
+    return dict(payload)
+
+def _verify_access_token(token: str) -> dict:
+    """
+    Verifies the signature and claims of a JWT access token.
 
     :param token: Encoded JWT token.
     :return: Decoded payload data.
@@ -0,0 +1,107 @@
+"""
+Prefix autocomplete for CRUDBase services, served from an in-memory PrefixIndex.
+"""
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, List, Set, Tuple
+from pymongo.errors import PyMongoError
+from app.settings.settings import settings
+from app.utils.prefix_index import PrefixIndex
+
+logger = logging.getLogger(__name__)
+
+
+class SuggestionsMixin(ABC):
+    """
+    Adds ``suggest`` to a CRUDBase service and keeps its prefix index in sync
+    through the write hooks. List it before CRUDBase in the bases and define
+    ``suggestions``, ``suggestion_fields`` and ``_suggestion``.
+    """
+
+    # Índice compartido por todas las instancias del servicio
+    suggestions: PrefixIndex
+    suggestion_fields: Tuple[str, ...]
+
+    # Referencias a las recargas en curso: asyncio solo guarda referencias débiles a las tareas
+    _refresh_tasks: Set[asyncio.Task] = set()
+
+    @abstractmethod
+    def _suggestion(self, document: dict) -> Tuple[Any, List[str]]:
+        """
+        Build the prefix index entry of a document.
+
+        :param document: Document with at least ``_id`` and ``suggestion_fields``.
+        :return: The value returned by ``suggest`` and the texts it is found by.
+        """
+
+    async def load_suggestions(self) -> None:
+        """
+        Build the prefix index from the active documents (only the suggestion fields).
+
+        Documents written through this process while they are read keep the state
+        of that write, so a reload never brings back an older version.
+        """
+        since = self.suggestions.generation
+        documents = await self.collection.find(
+            {"is_active": True}, {field: 1 for field in self.suggestion_fields}
+        ).to_list(length=None)
+        self.suggestions.rebuild(
+            ((str(document["_id"]), *self._suggestion(document)) for document in documents),
+            since)
+
+    async def suggest(self, prefix: str, limit: int = 10) -> List[Any]:
+        """
+        Return the entries whose suggestion keys start with a prefix, from memory.
+
+        The index is built on first use and reloaded in the background every
+        SUGGEST_REFRESH_SECONDS, to pick up writes made by other processes.
+
+        :param prefix: Text typed by the user (case and accents are ignored).
+        :param limit: Maximum number of entries.
+        :return: Suggestion models, ordered by the matched key.
+        """
+        if self.suggestions.loaded_at is None:
+            await self.load_suggestions()
+        elif (self.suggestions.is_stale(settings.SUGGEST_REFRESH_SECONDS)
+              and not self.suggestions.refreshing):
+            # Se sigue respondiendo con el índice actual mientras se recarga
+            self.suggestions.refreshing = True
+            task = asyncio.create_task(self._refresh_suggestions())
+            self._refresh_tasks.add(task)
+            task.add_done_callback(self._refresh_tasks.discard)
+        return self.suggestions.search(prefix, limit)
+
+    async def _refresh_suggestions(self) -> None:
+        """Reload the prefix index, keeping the current one if MongoDB fails."""
+        try:
+            await self.load_suggestions()
+        except PyMongoError:
+            logger.exception("Could not refresh the %s suggestions", self.collection.name)
+        finally:
+            self.suggestions.refreshing = False
+
+    def _sync_suggestion(self, document: dict) -> None:
+        """Add, replace or (when inactive) remove a written document in the prefix index."""
+        # También antes de la primera carga: si ya está leyendo, la escritura debe prevalecer
+        document_id = str(document["_id"])
+        if document.get("is_active", True):
+            self.suggestions.upsert(document_id, *self._suggestion(document))
+        else:
+            self.suggestions.remove(document_id)
+
+    async def _on_created(self, document: dict) -> None:
+        """Add the new document to the prefix index."""
+        self._sync_suggestion(document)
+        await super()._on_created(document)
+
+    async def _on_updated(self, before: dict, after: dict) -> None:
+        """Replace the document in the prefix index, or remove it if it was disabled."""
+        self._sync_suggestion(after)
+        await super()._on_updated(before, after)
+
+    async def _on_deleted(self, document: dict) -> None:
+        """Remove the disabled document from the prefix index."""
+        self._sync_suggestion({**document, "is_active": False})
+        await super()._on_deleted(document)
@@ -0,0 +1,135 @@
+"""
+Per-request timing breakdown reported in the ``Server-Timing`` header.
+
+``TimingMiddleware`` opens a ``RequestTimings`` for every request in a context
+variable. Code on the request path adds its phases to it: the JWT decode and
+user lookup (``JWTAuthMiddleware``), MongoDB commands (``CommandMetrics``,
+running on Motor's worker threads with a copy of the context) and the route
+endpoint (``TimedRoute``).
+"""
+
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+from fastapi.routing import APIRoute
+
+# Orden y descripción de las fases en el encabezado Server-Timing
+PHASES = {
+    "jwt": "JWT decode",
+    "user": "User lookup",
+    "db": "MongoDB commands",
+    "handler": "Route handler",
+    "serialize": "Response serialization",
+}
+
+
+class RequestTimings:
+    """Accumulated duration of each phase of one request, in seconds."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.durations: Dict[str, float] = {}
+        self.handler_finished_at: Optional[float] = None
+
+    def add(self, phase: str, seconds: float) -> None:
+        """
+        Add time to a phase.
+
+        :param phase: Phase name (see ``PHASES``).
+        :param seconds: Elapsed time in seconds.
+        """
+        with self._lock:
+            self.durations[phase] = self.durations.get(phase, 0.0) + seconds
+
+    def response_started(self, now: float) -> None:
+        """
+        Close the serialization phase when the response headers are sent.
+
+        :param now: ``time.perf_counter()`` value at ``http.response.start``.
+        """
+        if self.handler_finished_at is not None:
+            self.add("serialize", now - self.handler_finished_at)
+
+    def header(self, total: float) -> str:
+        """
+        Render the ``Server-Timing`` header value.
+
+        :param total: Time from the start of the request to the response start.
+        :return: e.g. ``jwt;dur=0.02;desc="JWT decode", ..., total;dur=3.10``.
+        """
+        with self._lock:
+            durations = dict(self.durations)
+        metrics = [
+            f'{phase};dur={durations[phase] * 1000:.2f};desc="{description}"'
+            for phase, description in PHASES.items()
+            if phase in durations
+        ]
+        metrics.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(metrics)
+
+
+# Tiempos de la solicitud en curso (None fuera de una solicitud HTTP)
+request_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def record_timing(phase: str, seconds: float) -> None:
+    """
+    Add time to a phase of the current request, if there is one.
+
+    :param phase: Phase name (see ``PHASES``).
+    :param seconds: Elapsed time in seconds.
+    """
+    timings = request_timings.get()
+    if timings is not None:
+        timings.add(phase, seconds)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """
+    Measure a block of code as a phase of the current request.
+
+    :param phase: Phase name (see ``PHASES``).
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_timing(phase, time.perf_counter() - start)
+
+
+def _timed_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap an async endpoint to record its duration as the ``handler`` phase."""
+
+    @functools.wraps(endpoint)
+    async def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await endpoint(*args, **kwargs)
+        finally:
+            finished = time.perf_counter()
+            record_timing("handler", finished - start)
+            timings = request_timings.get()
+            if timings is not None:
+                timings.handler_finished_at = finished
+
+    wrapper.timed = True
+    return wrapper
+
+
+class TimedRoute(APIRoute):
+    """
+    APIRoute that times its endpoint, so the time between the endpoint's return and
+    the response start can be reported as serialization.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        # Los endpoints síncronos se ejecutan en un hilo y no se envuelven; include_router
+        # vuelve a crear la ruta con el endpoint ya envuelto
+        if inspect.iscoroutinefunction(endpoint) and not getattr(endpoint, "timed", False):
+            endpoint = _timed_endpoint(endpoint)
+        super().__init__(path, endpoint, **kwargs)
@@ -0,0 +1,138 @@
+"""
+Stage-by-stage cost of the model conversion hot path, for every model and
+page sizes of 1, 100 and 1000 documents:
+
+- convert:   CRUDBase._convert_document on the documents read from MongoDB
+- validate:  FastAPI's response_model check of the returned models
+- serialize: response_model serialization to JSON bytes
+
+    python -m benchmarks.bench_conversion [--model Course] [--sizes 1,100,1000]
+
+Allocations are measured with tracemalloc on a separate run of each stage:
+peak memory while it runs and memory blocks still alive afterwards (the models
+and JSON it produced).
+"""
+
+import argparse
+import os
+import timeit
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple, Type
+
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-with-32-bytes!")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "120")
+
+# pylint: disable=wrong-import-position
+from bson import ObjectId
+from pydantic import BaseModel, TypeAdapter
+from app.modules.classrooms.models import Classroom
+from app.modules.courses.models import Course
+from app.modules.formRegisters.models import FormRegister
+from app.modules.teachers.models import Teacher
+from app.modules.users.models import UserBase
+from app.utils.crud_base import CRUDBase
+from benchmarks.bench_serialization import make_page as make_form_page
+
+AUDIT = {
+    "created_at": datetime(2024, 3, 1, 8),
+    "created_by": "10000001",
+    "updated_at": None,
+    "updated_by": None,
+    "is_active": True,
+}
+
+
+def _documents(template: Callable[[int], dict]) -> Callable[[int], List[dict]]:
+    """Build a page factory from a per-document template."""
+    return lambda size: [{"_id": ObjectId(), **template(i), **AUDIT} for i in range(size)]
+
+
+# Modelo -> (colección, generador de documentos como los guarda MongoDB)
+MODELS: Dict[str, Tuple[Type[BaseModel], str, Callable[[int], List[dict]]]] = {
+    "FormRegister": (FormRegister, "form_registers", make_form_page),
+    "Course": (Course, "courses", _documents(lambda i: {
+        "name": f"Curso {i}", "code": f"C{i}", "description": "Descripción del curso " * 3})),
+    "Teacher": (Teacher, "teachers", _documents(lambda i: {
+        "name": "Ana", "lastname": f"Pérez {i}", "identification_number": f"{10000000 + i}",
+        "email": f"docente{i}@example.com", "mobile_phone": "3000000000", "role": "teacher"})),
+    "Classroom": (Classroom, "classrooms", _documents(lambda i: {
+        "name": f"Aula {i}", "code": f"A{i}"})),
+    "UserBase": (UserBase, "users", _documents(lambda i: {
+        "name": "Ana", "lastname": f"Pérez {i}", "identification_number": f"{10000000 + i}",
+        "email": f"usuario{i}@example.com", "role": "teacher", "password": "$2b$12$" + "x" * 53})),
+}
+
+
+def allocations(func: Callable[[], object]) -> Tuple[float, int]:
+    """
+    Run a function once under tracemalloc.
+
+    :return: Peak KiB allocated while it ran and memory blocks still alive afterwards.
+    """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = func()
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return peak / 1024, blocks
+
+
+def bench_model(name: str, size: int, budget: int) -> List[Tuple[str, float, float, int]]:
+    """
+    Time each stage for one model and page size.
+
+    :param name: Key of MODELS.
+    :param size: Documents per page.
+    :param budget: Approximate number of documents processed per stage.
+    :return: One (stage, seconds per page, peak KiB, live blocks) tuple per stage.
+    """
+    model, collection, factory = MODELS[name]
+    service = CRUDBase({collection: None}, collection, model)
+    documents = factory(size)
+    adapter = TypeAdapter(List[model])
+
+    def convert():
+        # Copia superficial: _convert_document reemplaza el ObjectId por su texto
+        return [service._convert_document(dict(doc)) for doc in documents]  # pylint: disable=protected-access
+
+    models = convert()
+    stages = [
+        ("convert", convert),
+        ("validate", lambda: adapter.validate_python(models)),
+        ("serialize", lambda: adapter.dump_json(models, by_alias=True)),
+    ]
+
+    iterations = max(3, budget // size)
+    results = []
+    for stage, func in stages:
+        seconds = min(timeit.repeat(func, number=iterations, repeat=3)) / iterations
+        peak, blocks = allocations(func)
+        results.append((stage, seconds, peak, blocks))
+    return results
+
+
+def main(models: List[str], sizes: List[int], budget: int) -> None:
+    """Print one line per model, page size and stage."""
+    print(f"{'model':13s} {'size':>5s} {'stage':10s} {'ms/page':>9s} {'us/doc':>8s} "
+          f"{'peak KiB':>9s} {'blocks':>7s}")
+    for name in models:
+        for size in sizes:
+            for stage, seconds, peak, blocks in bench_model(name, size, budget):
+                print(f"{name:13s} {size:5d} {stage:10s} {seconds * 1e3:9.3f} "
+                      f"{seconds / size * 1e6:8.2f} {peak:9.1f} {blocks:7d}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--model", choices=sorted(MODELS), action="append",
+                        help="benchmark only this model (repeatable)")
+    parser.add_argument("--sizes", default="1,100,1000", help="comma separated page sizes")
+    parser.add_argument("--budget", type=int, default=20000,
+                        help="approximate documents processed per stage and size")
+    args = parser.parse_args()
+    main(args.model or list(MODELS), [int(size) for size in args.sizes.split(",")], args.budget)
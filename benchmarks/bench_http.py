@@ -0,0 +1,317 @@
+"""
+End-to-end HTTP benchmark of every router, driving ``app.main:app`` in-process.
+
+    python -m benchmarks.bench_http [--requests 300] [--concurrency 8]
+                                    [--mongo-uri mongodb://localhost:27017]
+                                    [--save-baseline] [--tolerance 0.3]
+
+Without ``--mongo-uri`` the database is mongomock-motor (in memory), so the
+numbers measure the application stack rather than MongoDB. Each scenario
+reports requests/sec, p50/p95/p99 latency and MongoDB round trips per request,
+and is compared with ``benchmarks/baselines/bench_http.<backend>.json``: a
+throughput drop beyond the tolerance is flagged and the exit status is 1.
+Baselines depend on the machine; refresh them with ``--save-baseline``.
+
+Requires ``httpx`` (and ``mongomock-motor`` for the in-memory backend).
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List
+
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-with-32-bytes!")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "120")
+
+# pylint: disable=wrong-import-position
+import httpx
+from pymongo import monitoring
+from app.db.indexes import ensure_indexes
+from app.db.mongodb import MongoDB
+from app.main import app
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+DATABASE = "bench_http"
+
+ADMIN = {"identification_number": "10000001", "password": "bench-admin"}
+TEACHER = {"identification_number": "70000001", "password": "bench-teacher"}
+
+FORM = {
+    "dia": "Lunes", "fecha": "2024-03-04", "jornada": "Mañana", "aula": "A1",
+    "nombre": "Ana", "apellido": "Pérez", "cedula": TEACHER["identification_number"],
+    "modulo": "Módulo 1", "contenido": "Contenido de la clase", "horaEntrada": "08:00",
+    "horaSalida": "10:00", "cantidadHoras": 2, "horaRegistroEntrada": None, "direccion": None,
+}
+
+# Operaciones de mongomock que equivalen a una ida y vuelta al servidor
+MONGOMOCK_OPERATIONS = (
+    "find", "find_one", "insert_one", "insert_many", "update_one", "update_many",
+    "replace_one", "delete_one", "delete_many", "find_one_and_update", "count_documents",
+    "estimated_document_count", "aggregate", "bulk_write", "distinct",
+)
+
+
+class RoundTrips(monitoring.CommandListener):
+    """Counts commands sent to MongoDB (real server) or mongomock operations."""
+
+    def __init__(self):
+        self.count = 0
+        self._depth = 0
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        self.count += 1
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        pass
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        pass
+
+    def count_mongomock(self) -> None:
+        """Wrap the mongomock collection operations to count them."""
+        from mongomock.collection import Collection  # pylint: disable=import-outside-toplevel
+
+        def counted(method):
+            @functools.wraps(method)
+            def wrapper(*args, **kwargs):
+                # Solo la operación externa: find_one, por ejemplo, llama a find
+                if self._depth == 0:
+                    self.count += 1
+                self._depth += 1
+                try:
+                    return method(*args, **kwargs)
+                finally:
+                    self._depth -= 1
+            return wrapper
+
+        for name in MONGOMOCK_OPERATIONS:
+            setattr(Collection, name, counted(getattr(Collection, name)))
+
+
+class Context:
+    """Tokens and documents shared by the scenarios."""
+
+    def __init__(self, client: httpx.AsyncClient):
+        self.client = client
+        self.admin: Dict[str, str] = {}
+        self.teacher: Dict[str, str] = {}
+        self.created: Dict[str, List[str]] = {}
+
+    def ids(self, resource: str) -> List[str]:
+        """IDs created for a resource so far."""
+        return self.created.setdefault(resource, [])
+
+
+Scenario = Callable[[Context, int], Awaitable[httpx.Response]]
+
+
+def catalog_scenarios(resource: str, payload: Callable[[int], dict], update: dict):
+    """Create, get, list, update and delete scenarios for a catalog router."""
+
+    async def create(ctx: Context, i: int) -> httpx.Response:
+        response = await ctx.client.post(f"/{resource}/", json=payload(i), headers=ctx.admin)
+        ctx.ids(resource).append(response.json()["_id"])
+        return response
+
+    async def get(ctx: Context, i: int) -> httpx.Response:
+        ids = ctx.ids(resource)
+        return await ctx.client.get(f"/{resource}/{ids[i % len(ids)]}", headers=ctx.admin)
+
+    async def list_page(ctx: Context, i: int) -> httpx.Response:
+        return await ctx.client.get(f"/{resource}/?limit=100", headers=ctx.admin)
+
+    async def put(ctx: Context, i: int) -> httpx.Response:
+        ids = ctx.ids(resource)
+        return await ctx.client.put(f"/{resource}/{ids[i % len(ids)]}", json=update, headers=ctx.admin)
+
+    async def delete(ctx: Context, i: int) -> httpx.Response:
+        return await ctx.client.delete(f"/{resource}/{ctx.ids(resource)[i]}", headers=ctx.admin)
+
+    return [
+        (f"{resource}: create", create),
+        (f"{resource}: get", get),
+        (f"{resource}: list", list_page),
+        (f"{resource}: update", put),
+        (f"{resource}: delete", delete),
+    ]
+
+
+async def login(ctx: Context, i: int) -> httpx.Response:
+    return await ctx.client.post("/auth/login", json=ADMIN)
+
+
+async def form_create(ctx: Context, i: int) -> httpx.Response:
+    response = await ctx.client.post("/forms/", json=FORM, headers=ctx.teacher)
+    ctx.ids("forms").append(response.json()["_id"])
+    return response
+
+
+async def form_list_admin(ctx: Context, i: int) -> httpx.Response:
+    return await ctx.client.get("/forms/?limit=100", headers=ctx.admin)
+
+
+async def form_update(ctx: Context, i: int) -> httpx.Response:
+    ids = ctx.ids("forms")
+    return await ctx.client.put(
+        f"/forms/{ids[i % len(ids)]}", json={"cantidadHoras": 3}, headers=ctx.teacher)
+
+
+async def form_list_teacher(ctx: Context, i: int) -> httpx.Response:
+    return await ctx.client.get("/forms/?limit=100", headers=ctx.teacher)
+
+
+SCENARIOS: List[tuple] = [
+    ("auth: login", login),
+    *catalog_scenarios(
+        "courses",
+        lambda i: {"name": f"Curso {i}", "code": f"B{i}", "description": "Benchmark"},
+        {"name": "Curso actualizado", "is_active": True}),
+    *catalog_scenarios(
+        "classrooms",
+        lambda i: {"name": f"Aula {i}", "code": f"B{i}", "is_active": True},
+        {"name": "Aula actualizada", "is_active": True}),
+    *catalog_scenarios(
+        "teachers",
+        lambda i: {"name": "Docente", "lastname": f"N{i}", "identification_number": f"8{i:07d}",
+                   "email": f"docente{i}@example.com", "mobile_phone": "3000000000",
+                   "is_active": True, "role": "teacher"},
+        {"name": "Docente actualizado", "is_active": True, "role": "teacher"}),
+    ("forms: create", form_create),
+    ("forms: list (admin)", form_list_admin),
+    ("forms: update", form_update),
+    ("forms: list (teacher)", form_list_teacher),
+]
+
+
+async def setup(ctx: Context) -> None:
+    """Register and log in an admin and a teacher."""
+    for user, role in ((ADMIN, "admin"), (TEACHER, "teacher")):
+        await ctx.client.post("/auth/register", json={
+            **user, "name": "Bench", "lastname": role, "email": f"{role}@example.com", "role": role,
+        })
+    for user, headers in ((ADMIN, ctx.admin), (TEACHER, ctx.teacher)):
+        response = await ctx.client.post("/auth/login", json=user)
+        response.raise_for_status()
+        headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+
+
+async def run_scenario(
+    ctx: Context, scenario: Scenario, requests: int, concurrency: int, round_trips: RoundTrips
+) -> dict:
+    """Send ``requests`` requests with ``concurrency`` workers and aggregate the results."""
+    latencies: List[float] = []
+    next_index = iter(range(requests))
+
+    async def worker() -> None:
+        for i in next_index:
+            start = time.perf_counter()
+            response = await scenario(ctx, i)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                raise RuntimeError(f"{response.status_code}: {response.text[:200]}")
+
+    round_trips.count = 0
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "rps": requests / elapsed,
+        "p50_ms": percentiles[49] * 1000,
+        "p95_ms": percentiles[94] * 1000,
+        "p99_ms": percentiles[98] * 1000,
+        "round_trips": round_trips.count / requests,
+    }
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    """Return the scenarios whose throughput dropped beyond the tolerance."""
+    return [
+        name for name, result in results.items()
+        if name in baseline and result["rps"] < baseline[name]["rps"] * (1 - tolerance)
+    ]
+
+
+def report(results: Dict[str, dict], baseline: Dict[str, dict], regressions: List[str]) -> None:
+    """Print one line per scenario."""
+    print(f"{'scenario':24s} {'req/s':>8s} {'p50 ms':>8s} {'p95 ms':>8s} {'p99 ms':>8s} "
+          f"{'mongo/req':>9s} {'vs base':>8s}")
+    for name, result in results.items():
+        delta = ""
+        if name in baseline:
+            delta = f"{(result['rps'] / baseline[name]['rps'] - 1) * 100:+.0f}%"
+        flag = "  REGRESSION" if name in regressions else ""
+        print(f"{name:24s} {result['rps']:8.0f} {result['p50_ms']:8.2f} {result['p95_ms']:8.2f} "
+              f"{result['p99_ms']:8.2f} {result['round_trips']:9.1f} {delta:>8s}{flag}")
+
+
+async def main(args: argparse.Namespace) -> int:
+    """Run every scenario against a fresh database and compare with the baseline."""
+    round_trips = RoundTrips()
+    if args.mongo_uri:
+        backend = "mongodb"
+        os.environ["MONGO_URI"] = args.mongo_uri
+        os.environ["MONGO_DB"] = DATABASE
+        monitoring.register(round_trips)
+        await MongoDB.connect()
+        await MongoDB.client.drop_database(DATABASE)
+    else:
+        from mongomock_motor import AsyncMongoMockClient  # pylint: disable=import-outside-toplevel
+        backend = "mongomock"
+        round_trips.count_mongomock()
+        MongoDB.client = AsyncMongoMockClient()
+        MongoDB.db = MongoDB.client[DATABASE]
+    await ensure_indexes(MongoDB.db)
+
+    results: Dict[str, dict] = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        ctx = Context(client)
+        await setup(ctx)
+        for name, scenario in SCENARIOS:
+            if args.only and args.only not in name:
+                continue
+            # El login usa bcrypt: se limita para no dominar el tiempo total
+            requests = min(args.requests, 50) if name == "auth: login" else args.requests
+            results[name] = await run_scenario(
+                ctx, scenario, requests, args.concurrency, round_trips)
+
+    if args.mongo_uri:
+        await MongoDB.client.drop_database(DATABASE)
+        await MongoDB.close()
+
+    baseline_path = BASELINE_DIR / f"bench_http.{backend}.json"
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+    regressions = compare(results, baseline, args.tolerance)
+    report(results, baseline, regressions)
+
+    if args.save_baseline:
+        BASELINE_DIR.mkdir(exist_ok=True)
+        rounded = {name: {key: round(value, 2) for key, value in result.items()}
+                   for name, result in results.items()}
+        baseline_path.write_text(json.dumps({**baseline, **rounded}, indent=2) + "\n")
+        print(f"Baseline saved to {baseline_path}")
+        return 0
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=300, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--mongo-uri", help="benchmark a real MongoDB instead of mongomock")
+    parser.add_argument("--only", help="run only the scenarios whose name contains this text")
+    parser.add_argument("--tolerance", type=float, default=0.3,
+                        help="allowed throughput drop before flagging a regression")
+    parser.add_argument("--save-baseline", action="store_true")
+    sys.exit(asyncio.run(main(parser.parse_args())))
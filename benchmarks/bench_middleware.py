@@ -0,0 +1,115 @@
+"""
+Throughput of a trivial authenticated endpoint with the pure ASGI middlewares
+versus the previous BaseHTTPMiddleware-based stack.
+
+    python -m benchmarks.bench_middleware --requests 5000
+
+Requires ``httpx``. The user lookup is served from the authentication cache,
+so the numbers isolate the middleware overhead (no MongoDB needed).
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-with-32-bytes!")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "120")
+
+# pylint: disable=wrong-import-position
+import httpx
+from bson import ObjectId
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from app.middlewares.auth_middleware import JWTAuthMiddleware
+from app.middlewares.error_handler import ErrorHandlerMiddleware, build_error_response
+from app.modules.users.models import UserBase, UserRole
+from app.modules.users.service import user_cache
+from app.utils.security import create_access_token
+
+
+async def _fake_database():
+    """Stand-in database: the user is always resolved from the cache."""
+    return {"users": None}
+
+
+class LegacyJWTAuthMiddleware(BaseHTTPMiddleware):
+    """Previous BaseHTTPMiddleware wrapper around the same authentication logic."""
+
+    def __init__(self, app):
+        super().__init__(app)
+        self.auth = JWTAuthMiddleware(app, db_dependency=_fake_database, exclude_paths={"/"})
+
+    async def dispatch(self, request: Request, call_next):
+        request.state.user = await self.auth.authenticate(request)
+        return await call_next(request)
+
+
+async def legacy_error_handler(request: Request, call_next):
+    """Previous ``app.middleware("http")`` error handler."""
+    try:
+        return await call_next(request)
+    except Exception as exc:  # noqa: BLE001
+        return build_error_response(request, exc)
+
+
+def _build_app(legacy: bool) -> FastAPI:
+    """Build a minimal app with one authenticated endpoint."""
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping(request: Request):
+        return {"user": request.state.user.identification_number}
+
+    if legacy:
+        app.middleware("http")(legacy_error_handler)
+        app.add_middleware(LegacyJWTAuthMiddleware)
+    else:
+        app.add_middleware(
+            JWTAuthMiddleware, db_dependency=_fake_database, exclude_paths={"/"})
+        app.add_middleware(ErrorHandlerMiddleware)
+    return app
+
+
+async def _run(app: FastAPI, token: str, total: int, concurrency: int) -> float:
+    """Send ``total`` requests and return the achieved requests per second."""
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Authorization": f"Bearer {token}"}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get("/ping", headers=headers)  # warm-up
+        per_worker = total // concurrency
+
+        async def worker():
+            for _ in range(per_worker):
+                response = await client.get("/ping", headers=headers)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return per_worker * concurrency / elapsed
+
+
+async def main(total: int, concurrency: int) -> None:
+    """Compare both middleware stacks."""
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    user_id = str(ObjectId())
+    user_cache.set(user_id, UserBase(
+        name="Bench", lastname="User", identification_number="1234567890",
+        email="bench@example.com", role=UserRole.ADMIN), ttl=3600)
+    token = create_access_token({"sub": user_id})
+
+    before = await _run(_build_app(legacy=True), token, total, concurrency)
+    after = await _run(_build_app(legacy=False), token, total, concurrency)
+    print(f"BaseHTTPMiddleware: {before:10.1f} req/s")
+    print(f"Pure ASGI:          {after:10.1f} req/s  ({after / before:.2f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,102 @@
+"""
+CPU cost of turning a page of 100 stored forms into a JSON response body:
+building the models from the stored documents and encoding them.
+
+    python -m benchmarks.bench_serialization --iterations 200
+"""
+
+import argparse
+import json
+import os
+import timeit
+from datetime import datetime, timedelta
+from typing import List
+
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-with-32-bytes!")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "120")
+
+# pylint: disable=wrong-import-position
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from app.modules.formRegisters.models import FormRegister
+from app.utils.dates import TIME_ANCHOR
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional, solo se mide si está instalado
+    orjson = None
+
+PAGE_SIZE = 100
+
+
+def make_page(size: int = PAGE_SIZE) -> List[dict]:
+    """Build documents shaped like the ones read from ``form_registers``."""
+    anchor = datetime.combine(TIME_ANCHOR, datetime.min.time())
+    return [
+        {
+            "_id": ObjectId(),
+            "dia": "Lunes",
+            "fecha": datetime(2024, 3, 1) + timedelta(days=index % 28),
+            "jornada": "Mañana",
+            "aula": f"A{index % 12}",
+            "nombre": "Ana",
+            "apellido": "Pérez",
+            "cedula": f"{10000000 + index % 50}",
+            "modulo": f"Módulo {index % 8}",
+            "contenido": "Contenido de la clase " * 4,
+            "horaEntrada": anchor + timedelta(hours=8),
+            "horaSalida": anchor + timedelta(hours=10),
+            "cantidadHoras": 2.0,
+            "horaRegistroEntrada": anchor + timedelta(hours=7, minutes=55),
+            "direccion": None,
+            "created_at": datetime(2024, 3, 1, 8),
+            "created_by": "admin",
+            "updated_at": None,
+            "updated_by": None,
+            "is_active": True,
+        }
+        for index in range(size)
+    ]
+
+
+def as_read(documents: List[dict]) -> List[dict]:
+    """Documents as ``_convert_document`` receives them (string ids)."""
+    return [{**doc, "_id": str(doc["_id"])} for doc in documents]
+
+
+def main(iterations: int) -> None:
+    """Time each step for one page and print the cost per page."""
+    documents = as_read(make_page())
+    models = [FormRegister.model_validate(doc) for doc in documents]
+    adapter = TypeAdapter(List[FormRegister])
+
+    cases = [
+        # Antes: _convert_document + Model(**model) en get_all_* (dos validaciones)
+        ("build: Model(**doc) twice", lambda: [
+            FormRegister(**FormRegister(**doc).model_dump(by_alias=True)) for doc in documents]),
+        ("build: model_validate once", lambda: [
+            FormRegister.model_validate(doc) for doc in documents]),
+        ("build: model_construct", lambda: [
+            FormRegister.model_construct(**doc) for doc in documents]),
+        ("response_model check of instances", lambda: adapter.validate_python(models)),
+        ("encode: jsonable_encoder + json", lambda: json.dumps(jsonable_encoder(models)).encode()),
+        ("encode: response_model dump_json", lambda: adapter.dump_json(models, by_alias=True)),
+    ]
+    if orjson is not None:
+        cases.append((
+            "encode: model_dump + orjson",
+            lambda: orjson.dumps([model.model_dump(mode="json", by_alias=True) for model in models]),
+        ))
+
+    print(f"per {PAGE_SIZE}-item page:")
+    for name, func in cases:
+        elapsed = timeit.timeit(func, number=iterations)
+        print(f"  {name:34s} {elapsed / iterations * 1e3:8.3f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    main(parser.parse_args().iterations)
@@ -0,0 +1,401 @@
+"""
+Generate and bulk-load a synthetic dataset for scale testing.
+
+    python -m benchmarks.generate_dataset [--scale 1.0] [--seed 42]
+                                          [--mongo-uri mongodb://localhost:27017]
+                                          [--database scale_test] [--drop]
+                                          [--batch-size 5000] [--concurrency 4]
+
+At ``--scale 1`` it writes 2,000 teachers with their user accounts plus a few
+admins, 300 courses, 200 classrooms and 1,000,000 form registers; every count
+is multiplied by the scale. Documents have the shape the services write
+(``<Model>Create.model_dump()`` plus the audit fields of ``CRUDBase.create``),
+with a small share of updated and soft-deleted ones. Forms reference the
+generated teachers, classrooms and courses: a few teachers file most of them,
+dates fall on school days and hours follow the ``jornada``.
+
+The same seed and scale always produce the same data (ObjectIds excepted).
+Indexes are created and the hours rollup is rebuilt after the load, which is
+faster than maintaining them row by row. Every user gets the password given
+with ``--password``.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import time
+import unicodedata
+from datetime import date, datetime, timedelta
+from typing import Iterator, List, Optional
+
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-with-32-bytes!")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "120")
+
+# pylint: disable=wrong-import-position
+from app.db.indexes import ensure_indexes
+from app.db.mongodb import MongoDB
+from app.modules.classrooms.models import ClassroomCreate
+from app.modules.courses.models import CourseCreate
+from app.modules.formRegisters.models import FormRegisterCreate
+from app.modules.formRegisters.rollup import HoursRollup
+from app.modules.teachers.models import TeacherCreate
+from app.modules.users.models import UserCreate
+from app.utils.dates import TIME_ANCHOR
+from app.utils.security import hash_password
+
+logger = logging.getLogger("generate_dataset")
+
+# Cantidades con --scale 1
+BASE_COUNTS = {
+    "teachers": 2_000,
+    "admins": 10,
+    "courses": 300,
+    "classrooms": 200,
+    "form_registers": 1_000_000,
+}
+UPDATED_SHARE = 0.10
+DELETED_SHARE = 0.02
+FORMS_START = date(2023, 1, 16)
+FORMS_DAYS = 730
+
+FIRST_NAMES = [
+    "Ana", "Andrés", "Camila", "Carlos", "Daniela", "Diego", "Felipe", "Juan", "Julián",
+    "Laura", "Luisa", "María", "Natalia", "Paula", "Santiago", "Sebastián", "Sofía",
+    "Valentina", "Jorge", "Mónica", "Óscar", "Patricia", "Ricardo", "Gloria",
+]
+LAST_NAMES = [
+    "Álvarez", "Castro", "Díaz", "Gómez", "González", "Hernández", "Jiménez", "López",
+    "Martínez", "Muñoz", "Ortiz", "Pérez", "Ramírez", "Rodríguez", "Rojas", "Ruiz",
+    "Sánchez", "Torres", "Vargas", "Moreno", "Quintero", "Suárez", "Zapata", "Ospina",
+]
+SUBJECTS = [
+    "Matemáticas", "Física", "Química", "Biología", "Programación", "Bases de Datos",
+    "Redes", "Contabilidad", "Inglés", "Estadística", "Diseño Gráfico", "Electrónica",
+    "Administración", "Cálculo", "Sistemas Operativos", "Ética",
+]
+LEVELS = ["Básico", "Intermedio", "Avanzado", "I", "II", "III"]
+TOPICS = [
+    "Introducción al tema", "Taller práctico", "Evaluación parcial", "Revisión de ejercicios",
+    "Laboratorio", "Exposición de proyectos", "Repaso general", "Trabajo en grupo",
+]
+STREETS = ["Calle", "Carrera", "Avenida", "Transversal", "Diagonal"]
+WEEKDAYS = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"]
+
+# Jornada -> (peso, primera hora de entrada, última hora de entrada)
+JORNADAS = {"Mañana": (45, 6, 10), "Tarde": (35, 13, 16), "Noche": (20, 18, 19)}
+HOURS = [1.0, 1.5, 2.0, 2.5, 3.0, 4.0]
+HOURS_WEIGHTS = [10, 8, 40, 12, 22, 8]
+
+
+def ascii_slug(text: str) -> str:
+    """Lowercase ASCII version of a name, usable in an email address."""
+    folded = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return folded.lower().replace(" ", "")
+
+
+def check_shape(model: type, document: dict) -> None:
+    """
+    Fail fast if a generated document differs from what the service would store.
+
+    :param model: Create schema used by the service.
+    :param document: Generated document, audit fields included.
+    :raises ValueError: If validating and dumping it changes any field.
+    """
+    dumped = model.model_validate(document).model_dump()
+    changed = [name for name, value in dumped.items() if document.get(name) != value]
+    if changed:
+        raise ValueError(f"{model.__name__} shape mismatch in {changed}")
+
+
+class DatasetGenerator:
+    """Builds the documents of every collection from one seeded random generator."""
+
+    def __init__(self, seed: int, scale: float, password_hash: str):
+        """
+        :param seed: Seed of the random generator.
+        :param scale: Multiplier of ``BASE_COUNTS``.
+        :param password_hash: bcrypt hash stored for every user.
+        """
+        self.rng = random.Random(seed)
+        self.counts = {name: max(1, round(count * scale)) for name, count in BASE_COUNTS.items()}
+        self.password_hash = password_hash
+        self.admin_ids: List[str] = []
+        self.teachers: List[dict] = []
+        self.course_names: List[str] = []
+        self.classroom_codes: List[str] = []
+
+    def _audit(self, document: dict, created_at: datetime, created_by: str) -> dict:
+        """Add the fields CRUDBase writes on create, update and delete."""
+        document.update({"created_by": created_by, "created_at": created_at, "is_active": True})
+        roll = self.rng.random()
+        if roll < DELETED_SHARE:
+            document.update({"is_active": False, "deleted_by": self.rng.choice(self.admin_ids)})
+        elif roll < DELETED_SHARE + UPDATED_SHARE:
+            document.update({
+                "updated_at": created_at + timedelta(days=self.rng.randint(1, 60)),
+                "updated_by": created_by,
+            })
+        return document
+
+    def _created_at(self) -> datetime:
+        """A creation time before the forms start, with millisecond precision."""
+        offset = timedelta(seconds=self.rng.randint(0, 180 * 86400), milliseconds=self.rng.randint(0, 999))
+        return datetime.combine(FORMS_START, datetime.min.time()) - offset
+
+    def _identification_numbers(self, count: int) -> List[str]:
+        """Unique cédulas of 8 to 10 digits."""
+        return [str(number) for number in self.rng.sample(range(10_000_000, 1_500_000_000), count)]
+
+    def users_and_teachers(self) -> Iterator[tuple]:
+        """
+        Yield ("users" | "teachers", document) pairs: the admins first, then each
+        teacher together with its user account.
+        """
+        numbers = self._identification_numbers(self.counts["admins"] + self.counts["teachers"])
+        self.admin_ids = numbers[:self.counts["admins"]]
+        for index, number in enumerate(self.admin_ids):
+            yield "users", self._person(UserCreate, number, "admin", f"admin{index}", "system")
+
+        for index, number in enumerate(numbers[self.counts["admins"]:]):
+            teacher = self._person(TeacherCreate, number, "teacher", f"docente{index}",
+                                   self.rng.choice(self.admin_ids))
+            self.teachers.append(teacher)
+            yield "teachers", teacher
+            user = {name: teacher[name] for name in ("name", "lastname", "identification_number",
+                                                    "email", "role")}
+            user.update({"password": self.password_hash, "created_by": "system",
+                         "created_at": teacher["created_at"], "is_active": True})
+            yield "users", user
+
+    def _person(self, model: type, number: str, role: str, handle: str, created_by: str) -> dict:
+        """A teacher or user document."""
+        name, lastname = self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+        document = {
+            "name": name,
+            "lastname": f"{lastname} {self.rng.choice(LAST_NAMES)}",
+            "identification_number": number,
+            "email": f"{ascii_slug(name)}.{ascii_slug(lastname)}.{handle}@example.com",
+            "role": role,
+        }
+        if model is TeacherCreate:
+            document["mobile_phone"] = f"3{self.rng.randint(0, 999_999_999):09d}"
+        else:
+            document["password"] = self.password_hash
+        return self._audit(document, self._created_at(), created_by)
+
+    def courses(self) -> Iterator[dict]:
+        """Courses named after a subject and level."""
+        for index in range(self.counts["courses"]):
+            subject, level = self.rng.choice(SUBJECTS), self.rng.choice(LEVELS)
+            name = f"{subject} {level} {index + 1}"
+            self.course_names.append(name)
+            yield self._audit({
+                "name": name,
+                "code": f"{ascii_slug(subject)[:4].upper()}-{index + 1:04d}",
+                "description": f"Curso de {subject.lower()} nivel {level.lower()}.",
+            }, self._created_at(), self.rng.choice(self.admin_ids))
+
+    def classrooms(self) -> Iterator[dict]:
+        """Classrooms spread over a few buildings."""
+        for index in range(self.counts["classrooms"]):
+            code = f"B{index % 8 + 1}-{index // 8 + 101}"
+            self.classroom_codes.append(code)
+            yield self._audit({"name": f"Aula {code}", "code": code, "is_active": True},
+                              self._created_at(), self.rng.choice(self.admin_ids))
+
+    def form_registers(self) -> Iterator[dict]:
+        """
+        Forms with a skewed number per teacher (Zipf-like), on school days, with
+        hours that depend on the jornada.
+        """
+        rng = self.rng
+        teacher_weights = [1 / (rank + 1) ** 0.8 for rank in range(len(self.teachers))]
+        teacher_cum = _cumulative(teacher_weights)
+        jornadas = list(JORNADAS)
+        jornada_cum = _cumulative([JORNADAS[name][0] for name in jornadas])
+        hours_cum = _cumulative(HOURS_WEIGHTS)
+        # Domingo casi nunca tiene clases
+        days = [FORMS_START + timedelta(days=offset) for offset in range(FORMS_DAYS)]
+        day_cum = _cumulative([0.05 if day.weekday() == 6 else 1 for day in days])
+        anchor = datetime.combine(TIME_ANCHOR, datetime.min.time())
+
+        for _ in range(self.counts["form_registers"]):
+            teacher = rng.choices(self.teachers, cum_weights=teacher_cum)[0]
+            day = rng.choices(days, cum_weights=day_cum)[0]
+            jornada = rng.choices(jornadas, cum_weights=jornada_cum)[0]
+            _, first, last = JORNADAS[jornada]
+            hours = rng.choices(HOURS, cum_weights=hours_cum)[0]
+            entrada = anchor + timedelta(hours=rng.randint(first, last), minutes=rng.choice((0, 30)))
+            salida = entrada + timedelta(hours=hours)
+            registro = (entrada - timedelta(minutes=rng.randint(0, 15))
+                        if rng.random() < 0.85 else None)
+            fecha = datetime.combine(day, datetime.min.time())
+            created_at = fecha + (salida - anchor) + timedelta(
+                minutes=rng.randint(0, 90), milliseconds=rng.randint(0, 999))
+            yield self._audit({
+                "dia": WEEKDAYS[day.weekday()],
+                "fecha": fecha,
+                "jornada": jornada,
+                "aula": rng.choice(self.classroom_codes),
+                "nombre": teacher["name"],
+                "apellido": teacher["lastname"],
+                "cedula": teacher["identification_number"],
+                "modulo": rng.choice(self.course_names),
+                "contenido": rng.choice(TOPICS),
+                "horaEntrada": entrada,
+                "horaSalida": salida,
+                "cantidadHoras": hours,
+                "horaRegistroEntrada": registro,
+                "direccion": (f"{rng.choice(STREETS)} {rng.randint(1, 150)} # {rng.randint(1, 99)}-"
+                              f"{rng.randint(1, 99)}" if rng.random() < 0.3 else None),
+            }, created_at, teacher["identification_number"])
+
+
+def _cumulative(weights: List[float]) -> List[float]:
+    """Cumulative weights for ``random.choices``, computed once per collection."""
+    total, result = 0.0, []
+    for weight in weights:
+        total += weight
+        result.append(total)
+    return result
+
+
+class BulkLoader:
+    """Inserts documents with unordered ``insert_many`` batches, several in flight."""
+
+    def __init__(self, db, batch_size: int, concurrency: int):
+        """
+        :param db: Motor database.
+        :param batch_size: Documents per ``insert_many``.
+        :param concurrency: Batches sent at the same time.
+        """
+        self.db = db
+        self.batch_size = batch_size
+        self._slots = asyncio.Semaphore(concurrency)
+        self._pending: set = set()
+        self._batches = {}
+        self.inserted = {}
+
+    async def add(self, collection: str, document: dict) -> None:
+        """Queue a document, sending its batch when it is full."""
+        batch = self._batches.setdefault(collection, [])
+        batch.append(document)
+        if len(batch) >= self.batch_size:
+            self._batches[collection] = []
+            await self._send(collection, batch)
+
+    async def load(self, collection: str, documents: Iterator[dict],
+                   model: Optional[type] = None) -> None:
+        """
+        Queue every document of a generator and report the throughput.
+
+        :param collection: Target collection.
+        :param documents: Generated documents.
+        :param model: Create schema the first document is checked against.
+        """
+        start = time.perf_counter()
+        for document in documents:
+            if model is not None:
+                check_shape(model, document)
+                model = None
+            await self.add(collection, document)
+        await self.flush()
+        elapsed = time.perf_counter() - start
+        logger.info("%s: %d documents in %.1fs (%.0f/s)", collection, self.inserted[collection],
+                    elapsed, self.inserted[collection] / elapsed if elapsed else 0)
+
+    async def flush(self) -> None:
+        """Send the incomplete batches and wait for every batch in flight."""
+        for collection, batch in list(self._batches.items()):
+            if batch:
+                await self._send(collection, batch)
+        self._batches.clear()
+        if self._pending:
+            await asyncio.gather(*self._pending)
+
+    async def _send(self, collection: str, batch: List[dict]) -> None:
+        """Start an insert once a slot is free."""
+        await self._slots.acquire()
+        task = asyncio.create_task(self._insert(collection, batch))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+        # Cede el control para que el envío empiece mientras se genera el siguiente lote
+        await asyncio.sleep(0)
+
+    async def _insert(self, collection: str, batch: List[dict]) -> None:
+        try:
+            await self.db[collection].insert_many(batch, ordered=False)
+            self.inserted[collection] = self.inserted.get(collection, 0) + len(batch)
+        finally:
+            self._slots.release()
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Generate the dataset into the configured (or given) database."""
+    if args.mongo_uri:
+        os.environ["MONGO_URI"] = args.mongo_uri
+    if args.database:
+        os.environ["MONGO_DB"] = args.database
+    await MongoDB.connect()
+    try:
+        db = MongoDB.get_database()
+        await populate(db, args)
+    finally:
+        await MongoDB.close()
+
+
+async def populate(db, args: argparse.Namespace) -> None:
+    """
+    Load every collection, then create the indexes and rebuild the hours rollup.
+
+    :param db: Motor database.
+    :param args: Parsed command line options.
+    """
+    collections = ["users", "teachers", "courses", "classrooms", "form_registers"]
+    if args.drop:
+        for name in collections:
+            await db.drop_collection(name)
+    else:
+        for name in collections:
+            if await db[name].estimated_document_count():
+                raise SystemExit(f"{name} is not empty; use --drop to replace it")
+
+    generator = DatasetGenerator(args.seed, args.scale, hash_password(args.password))
+    logger.info("Generating %s", ", ".join(f"{count} {name}" for name, count in generator.counts.items()))
+    loader = BulkLoader(db, args.batch_size, args.concurrency)
+
+    start = time.perf_counter()
+    checked = set()
+    for collection, document in generator.users_and_teachers():
+        if collection not in checked:
+            check_shape(UserCreate if collection == "users" else TeacherCreate, document)
+            checked.add(collection)
+        await loader.add(collection, document)
+    await loader.flush()
+    logger.info("users: %d, teachers: %d", loader.inserted["users"], loader.inserted["teachers"])
+    await loader.load("courses", generator.courses(), CourseCreate)
+    await loader.load("classrooms", generator.classrooms(), ClassroomCreate)
+    await loader.load("form_registers", generator.form_registers(), FormRegisterCreate)
+
+    await ensure_indexes(db)
+    await HoursRollup(db).rebuild()
+    logger.info("Dataset ready in %.1fs", time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplier of the base counts")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--mongo-uri", help="defaults to the MONGO_URI setting")
+    parser.add_argument("--database", help="defaults to the MONGO_DB setting")
+    parser.add_argument("--drop", action="store_true",
+                        help="drop the generated collections first instead of refusing to "
+                             "write into non-empty ones")
+    parser.add_argument("--batch-size", type=int, default=5000, help="documents per insert_many")
+    parser.add_argument("--concurrency", type=int, default=4, help="insert_many calls in flight")
+    parser.add_argument("--password", default="dataset-password", help="password of every user")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,63 @@
+"""
+Shared fixtures: the API served in-process over an in-memory MongoDB.
+"""
+
+import os
+
+os.environ.setdefault("SECRET_KEY", "test-secret-key-with-at-least-32-bytes")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+from app.db.indexes import ensure_indexes
+from app.db.mongodb import MongoDB
+from app.main import app
+from app.modules.courses.services import CourseService
+from app.modules.teachers.services import TeacherService
+from app.modules.users.service import user_cache
+from app.utils.crud_base import count_cache, entity_caches
+from app.utils.prefix_index import PrefixIndex
+from app.utils.security import token_cache
+
+ADMIN = {
+    "name": "Ada", "lastname": "Admin", "identification_number": "10000",
+    "email": "admin@example.com", "role": "admin", "password": "secret",
+}
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def db():
+    """Fresh in-memory database with the application indexes and empty caches."""
+    for cache in (count_cache, user_cache, token_cache, *entity_caches.values()):
+        cache.clear()
+    CourseService.suggestions = PrefixIndex()
+    TeacherService.suggestions = PrefixIndex()
+    MongoDB.client = mongomock_motor.AsyncMongoMockClient()
+    MongoDB.db = MongoDB.client["test"]
+    await ensure_indexes(MongoDB.db)
+    yield MongoDB.db
+    MongoDB.client = MongoDB.db = None
+
+
+@pytest.fixture
+async def client(db):
+    """HTTP client authenticated as an admin."""
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as http:
+        await http.post("/auth/register", json=ADMIN)
+        response = await http.post("/auth/login", json={
+            "identification_number": ADMIN["identification_number"],
+            "password": ADMIN["password"],
+        })
+        http.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+        yield http
@@ -0,0 +1,68 @@
+"""
+Cursor paging of the chronological form listing.
+"""
+
+import pytest
+from bson import ObjectId
+
+from app.modules.formRegisters.service import FormRegisterService
+from app.utils.crud_base import CRUDBase
+from app.utils.pagination import decode_cursor
+
+
+FORM = {
+    "dia": "lunes", "jornada": "mañana", "aula": "A1", "nombre": "Ada",
+    "apellido": "Admin", "cedula": "10000", "modulo": "M1", "contenido": "c",
+    "horaEntrada": "08:00", "horaSalida": "10:00", "cantidadHoras": 2,
+    "horaRegistroEntrada": None, "direccion": None,
+}
+
+
+async def page_through(client, path):
+    """Follow X-Next-Cursor from the first page and return every item."""
+    items, cursor = [], None
+    while True:
+        url = f"{path}&cursor={cursor}" if cursor else path
+        response = await client.get(url)
+        assert response.status_code == 200
+        items.extend(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return items
+
+
+@pytest.mark.anyio
+async def test_cursor_pages_past_legacy_text_dates(client, db):
+    for fecha in ("2024-03-01", "2024-03-02", "2024-03-03"):
+        assert (await client.post("/forms/", json={**FORM, "fecha": fecha})).status_code == 200
+    # Fecha legada que migrate_dates no pudo convertir: queda como texto
+    await db["form_registers"].insert_one(
+        {**FORM, "fecha": "sin fecha", "is_active": True, "created_by": "10000"})
+
+    response = await client.get("/forms/?limit=1")
+    assert response.headers["X-Total-Count"] == "4"
+    items = await page_through(client, "/forms/?limit=1")
+
+    assert [item["fecha"][:10] for item in items] == [
+        "sin fecha", "2024-03-01", "2024-03-02", "2024-03-03"]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("limit", [0, -1, 100000])
+async def test_search_rejects_out_of_range_limits(client, limit):
+    response = await client.get(f"/forms/search?q=clase&limit={limit}")
+    assert response.status_code == 422
+
+
+@pytest.mark.anyio
+async def test_search_forms_without_rows_to_read(db):
+    service = FormRegisterService(db)
+    assert await service.search_forms("clase", limit=0) == ([], None)
+
+
+def test_trim_page_cursor_carries_the_sort_key():
+    documents = [{"_id": ObjectId(), "_score": score} for score in (3.0, 2.0, 1.0)]
+    page, cursor = CRUDBase._trim_page(documents, 2, "_score")
+    assert page == documents[:2]
+    assert decode_cursor(cursor) == (documents[1]["_id"], 2.0)
+    assert CRUDBase._trim_page(documents, 3, "_score") == (documents, None)
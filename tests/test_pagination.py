@@ -0,0 +1,57 @@
+"""
+Offset and cursor paging of the catalog listings.
+"""
+
+import pytest
+
+from app.db.mongodb import MongoDB
+from app.modules.courses.services import CourseService
+
+pytestmark = pytest.mark.anyio
+
+
+async def create_courses(client, count):
+    for index in range(count):
+        response = await client.post(
+            "/courses/", json={"name": f"Course {index}", "code": f"C{index}", "description": "d"})
+        assert response.status_code == 200
+
+
+@pytest.mark.parametrize("limit", [1, 2, 5, 6])
+async def test_cursor_pages_cover_the_collection_once(client, limit):
+    await create_courses(client, 5)
+    codes, cursor = [], None
+    while True:
+        url = f"/courses/?limit={limit}" + (f"&cursor={cursor}" if cursor else "")
+        response = await client.get(url)
+        assert response.status_code == 200
+        assert len(response.json()) <= limit
+        codes.extend(course["code"] for course in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert codes == [f"C{index}" for index in range(5)]
+
+
+async def test_skip_past_the_end_is_empty(client):
+    await create_courses(client, 2)
+    response = await client.get("/courses/?skip=5&limit=2")
+    assert response.status_code == 200
+    assert response.json() == []
+    assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.parametrize("path", [
+    "/courses/?limit=0", "/courses/?limit=-1", "/courses/?limit=100000", "/courses/?skip=-1",
+    "/classrooms/?limit=0", "/teachers/?limit=0", "/forms/?limit=0", "/forms/?limit=-1",
+])
+async def test_out_of_range_limits_are_rejected(client, path):
+    response = await client.get(path)
+    assert response.status_code == 422
+
+
+async def test_get_page_without_rows_to_read(client):
+    await create_courses(client, 2)
+    service = CourseService(MongoDB.db)
+    assert await service.get_page(limit=0) == ([], None)
+    assert await service.get_page(limit=-1) == ([], None)
@@ -0,0 +1,22 @@
+"""
+Validation of the environment settings.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from app.settings.settings import Settings
+
+
+@pytest.mark.parametrize("name", ["FORMS_BULK_CHUNK_SIZE", "FORMS_BULK_MAX_ITEMS"])
+@pytest.mark.parametrize("value", ["0", "-1"])
+def test_bulk_sizes_must_be_positive(monkeypatch, name, value):
+    monkeypatch.setenv(name, value)
+    with pytest.raises(ValidationError, match=name):
+        Settings()
+
+
+def test_bulk_size_defaults():
+    settings = Settings()
+    assert settings.FORMS_BULK_CHUNK_SIZE == 500
+    assert settings.FORMS_BULK_MAX_ITEMS == 1000
@@ -0,0 +1,66 @@
+"""
+Prefix index of the /suggest endpoints.
+"""
+
+import asyncio
+
+import pytest
+
+from app.modules.courses.services import CourseService
+from app.utils.crud_base import CRUDBase
+from app.utils.prefix_index import PrefixIndex
+from app.utils.suggestions import SuggestionsMixin
+
+
+def test_rebuild_keeps_writes_made_after_the_snapshot_was_read():
+    index = PrefixIndex()
+    index.rebuild([("1", "old", ["alpha"]), ("2", "gone", ["beta"])])
+    since = index.generation
+    index.upsert("1", "new", ["gamma"])
+    index.remove("2")
+
+    index.rebuild([("1", "old", ["alpha"]), ("2", "gone", ["beta"]), ("3", "other", ["alto"])],
+                  since)
+
+    assert index.search("a", 10) == ["other"]
+    assert index.search("g", 10) == ["new"]
+    assert index.search("b", 10) == []
+    # Una recarga posterior ya trae el estado escrito y vuelve a mandar
+    index.rebuild([("1", "newest", ["delta"])], index.generation)
+    assert index.search("d", 10) == ["newest"]
+
+
+@pytest.mark.anyio
+async def test_refresh_does_not_undo_a_concurrent_write(client, db):
+    response = await client.post("/courses/", json={"name": "Physics", "code": "OLD-1", "description": "d"})
+    course_id = response.json()["_id"]
+    service = CourseService(db)
+    await service.load_suggestions()
+
+    # La recarga lee la colección antes de la escritura y termina después
+    snapshot = await db["courses"].find({"is_active": True}).to_list(length=None)
+    written = asyncio.Event()
+
+    class SlowCursor:
+        async def to_list(self, length=None):
+            await written.wait()
+            return snapshot
+
+    service.collection = type("Collection", (), {"find": lambda *args: SlowCursor()})()
+    refresh = asyncio.create_task(service.load_suggestions())
+    await asyncio.sleep(0)
+    response = await client.put(f"/courses/{course_id}", json={"code": "NEW-1", "is_active": True})
+    assert response.status_code == 200
+    written.set()
+    await refresh
+
+    assert [course.code for course in await service.suggest("new")] == ["NEW-1"]
+    assert await service.suggest("old") == []
+
+
+def test_services_must_define_their_suggestion_entry():
+    class IncompleteService(SuggestionsMixin, CRUDBase[dict]):
+        suggestions = PrefixIndex()
+
+    with pytest.raises(TypeError, match="_suggestion"):
+        IncompleteService(None)
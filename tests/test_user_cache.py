@@ -0,0 +1,52 @@
+"""
+Authentication cache of active users.
+"""
+
+import asyncio
+
+import pytest
+
+from app.modules.users.service import UserService, user_cache
+from app.utils.cache import TTLCache
+
+
+def test_set_skips_values_loaded_before_an_invalidation():
+    cache = TTLCache(maxsize=2, ttl=60)
+    generation = cache.generation("a")
+    cache.invalidate("a")
+    cache.set("a", "stale", generation=generation)
+    assert cache.get("a") is None
+
+    cache.set("a", "fresh", generation=cache.generation("a"))
+    assert cache.get("a") == "fresh"
+
+
+def test_forgotten_invalidations_still_reject_older_loads():
+    cache = TTLCache(maxsize=1, ttl=60)
+    generation = cache.generation("a")
+    cache.invalidate("a")
+    cache.invalidate("b")  # Desplaza la marca de "a"
+    cache.set("a", "stale", generation=generation)
+    assert cache.get("a") is None
+
+
+@pytest.mark.anyio
+async def test_read_overlapping_a_delete_is_not_cached(client, db):
+    user_id = str((await db["users"].find_one({}))["_id"])
+    user_cache.invalidate(user_id)
+    service = UserService(db)
+    stale = await service.get_by_id(user_id)
+    deleted = asyncio.Event()
+
+    async def slow_get_by_id(document_id):
+        await deleted.wait()
+        return stale
+
+    service.get_by_id = slow_get_by_id
+    read = asyncio.create_task(service.get_active_user(user_id))
+    await asyncio.sleep(0)
+    assert await UserService(db).delete(user_id, "10000")
+    deleted.set()
+
+    assert (await read).is_active
+    assert user_cache.get(user_id) is None